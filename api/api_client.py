@@ -1,9 +1,44 @@
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import random
 import time
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# 재시도하지 않는 오류 / 재시도하는 전송 오류
+_UNRECOVERABLE_ERRORS = (requests.exceptions.SSLError, requests.exceptions.InvalidURL)
+_TRANSIENT_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _UNRECOVERABLE_ERRORS += (httpx.UnsupportedProtocol, httpx.InvalidURL)
+    _TRANSIENT_ERRORS += (httpx.TransportError,)
+
+# 오류 응답 본문은 진단용으로 앞부분만 읽음
+ERROR_BODY_LIMIT = 4096
+
+# GET 응답 캐시 최대 항목 수 기본값
+GET_CACHE_SIZE = 128
 
 # APIError 정의
 class APIError(Exception):
@@ -21,9 +56,16 @@ def get_logger():
         logger.setLevel(logging.INFO)
     return logger
 
+# 모듈 import 시 한 번만 초기화
+_LOGGER = get_logger()
+
 class APIClient:
+    # base_url 별로 공유되는 커넥션 풀 (인스턴스가 바뀌어도 연결 재사용)
+    # 세션은 인스턴스마다 따로 만들어 인증 정보/헤더가 서로 덮어쓰지 않도록 함
+    _shared_adapters: Dict[str, HTTPAdapter] = {}
+    
     def __init__(self, config: Dict[str, Any]):
-        self.logger = get_logger()
+        self.logger = _LOGGER
         self.config = config
         
         self.base_url = config.get('base_url', '').rstrip('/')
@@ -31,18 +73,189 @@ class APIClient:
         self.headers = config.get('headers', {})
         self.timeout = config.get('timeout', 30)
         self.max_retries = config.get('max_retries', 3)
+        self.base_delay = config.get('base_delay', 1.0)
+        self.max_delay = config.get('max_delay', 30)
+        self.jitter = config.get('jitter', 0.5)
         
         if not self.base_url:
             raise APIError("Missing required API configuration: base_url")
         
-        self.session = requests.Session()
+        self.shared_pool = config.get('shared_pool', True)
+        if self.shared_pool:
+            adapter = self._shared_adapters.get(self.base_url)
+            if adapter is None:
+                adapter = self._create_adapter(config)
+                self._shared_adapters[self.base_url] = adapter
+        else:
+            adapter = self._create_adapter(config)
+        self.session = self._create_session(adapter)
         self.session.headers.update(self.headers)
+        
+        # http2 설정 시 httpx 클라이언트 사용 (서버가 h2를 지원하지 않으면 HTTP/1.1로 동작)
+        self.client = None
+        if config.get('http2', False):
+            self.client = self._create_http2_client()
+        
+        # 헬스 체크 / GET 응답 TTL 캐시
+        self._health_ttl = config.get('health_ttl', 30)
+        self._health_cache: Optional[Tuple[float, bool]] = None
+        self._get_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._get_cache_size = config.get('get_cache_size', GET_CACHE_SIZE)
+        
+        # batch_events 설정 시 이벤트를 모아서 한 번에 전송
+        self.batch_events = config.get('batch_events', False)
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_max = config.get('batch_size', 32)
+        self._batch_flush_interval = config.get('batch_flush_interval', 5)
+        self._buffer_started: Optional[float] = None
+        
+        # 이벤트 루프 안에서 처음 사용할 때 생성 (aiohttp 세션은 루프에 묶임)
+        self._async_session: Optional[aiohttp.ClientSession] = None
+    
+    @staticmethod
+    def _create_adapter(config: Dict[str, Any]) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=config.get('pool_connections', 16),
+            pool_maxsize=config.get('pool_maxsize', 64),
+            max_retries=0
+        )
+    
+    @staticmethod
+    def _create_session(adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
     
-    def send_file_event(self, event_data: Dict[str, Any]) -> bool:
+    def _create_http2_client(self):
+        if httpx is None:
+            self.logger.warning("http2 is enabled but httpx is not installed, using requests")
+            return None
         
+        try:
+            return httpx.Client(
+                http2=True,
+                timeout=self.timeout,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        except ImportError as e:
+            # httpx[http2] (h2 패키지) 미설치
+            self.logger.warning("HTTP/2 support unavailable (%s), using requests", e)
+            return None
+    
+    @property
+    def _http(self):
+        return self.client if self.client is not None else self.session
+    
+    def _file_events_url(self) -> str:
         endpoint = self.endpoints.get('file_events', '/api/threat/file/darkweb')
-        url = f"{self.base_url}{endpoint}"                
-        return self._send_request('POST', url, json_data=event_data)
+        return f"{self.base_url}{endpoint}"
+    
+    def send_file_event(self, event_data: Dict[str, Any]) -> Optional[bool]:
+        # batch_events 모드에서는 버퍼에만 넣고 None(전송 대기)을 반환
+        # (나중에 전송이 실패하면 flush()가 실패한 이벤트를 반환하고, close()는 로그로 남김)
+        if not self.batch_events:
+            return self._send_request('POST', self._file_events_url(), json_data=event_data)
+        
+        if not self._buffer:
+            self._buffer_started = time.monotonic()
+        self._buffer.append(event_data)
+        
+        if (len(self._buffer) >= self._buffer_max or
+                time.monotonic() - self._buffer_started >= self._batch_flush_interval):
+            return not self.flush()
+        return None
+    
+    def send_file_events(self, events: List[Dict[str, Any]]) -> List[bool]:
+        if not events:
+            return []
+        
+        endpoint = self.endpoints.get(
+            'file_events_bulk',
+            self.endpoints.get('file_events', '/api/threat/file/darkweb') + '/bulk'
+        )
+        try:
+            success = self._send_request('POST', f"{self.base_url}{endpoint}", json_data={"events": events})
+        except APIError as e:
+            self.logger.error("Bulk file event request failed (%d events): %s", len(events), e)
+            success = False
+        return [success] * len(events)
+    
+    def flush(self) -> List[Dict[str, Any]]:
+        # 버퍼의 이벤트를 전송하고 전송하지 못한 이벤트 목록을 반환
+        events, self._buffer = self._buffer, []
+        self._buffer_started = None
+        results = self.send_file_events(events)
+        return [event for event, sent in zip(events, results) if not sent]
+    
+    async def send_file_event_async(self, event_data: Dict[str, Any]) -> bool:
+        return await self._send_request_async('POST', self._file_events_url(), json_data=event_data)
+    
+    async def send_file_events_async(self, events: List[Dict[str, Any]]) -> List[bool]:
+        results = await asyncio.gather(
+            *[self.send_file_event_async(event) for event in events],
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("File event failed: %s", result)
+        
+        return [result is True for result in results]
+    
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers
+            )
+        return self._async_session
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        # 상한이 있는 지수 백오프 + 지터 (동시 재시도가 한꺼번에 몰리지 않도록)
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return delay * (1 - self.jitter + random.random() * self.jitter)
+    
+    @staticmethod
+    def _decode_error_body(raw: bytes) -> Any:
+        # JSON 파싱을 한 번만 시도하고 실패하면 텍스트로 디코딩
+        try:
+            return _json_loads(raw)
+        except ValueError:
+            return raw.decode('utf-8', 'replace')
+    
+    def _request(self, method: str, url: str, body: Optional[bytes], params: Dict[str, Any] = None):
+        kwargs = {'params': params, 'timeout': self.timeout}
+        if body is not None:
+            # requests는 data=, httpx는 content=로 미리 인코딩된 본문을 받음
+            kwargs['content' if self.client is not None else 'data'] = body
+            kwargs['headers'] = JSON_HEADERS
+        
+        # 응답 본문은 필요할 때만 읽도록 스트리밍 모드로 요청
+        if self.client is not None:
+            return self.client.send(self.client.build_request(method, url, **kwargs), stream=True)
+        return self.session.request(method, url, stream=True, **kwargs)
+    
+    def _read_body_prefix(self, response) -> bytes:
+        # 본문을 ERROR_BODY_LIMIT 까지만 읽고 응답을 닫음
+        # (끝까지 읽은 응답만 연결이 풀로 돌아가고, 더 큰 본문은 연결을 끊음)
+        if self.client is not None:
+            chunks = response.iter_bytes()
+        else:
+            chunks = response.iter_content(chunk_size=ERROR_BODY_LIMIT)
+        
+        raw = b''
+        try:
+            for chunk in chunks:
+                raw += chunk
+                if len(raw) >= ERROR_BODY_LIMIT:
+                    break
+        finally:
+            response.close()
+        return raw[:ERROR_BODY_LIMIT]
     
     def _send_request(self, 
                      method: str,
@@ -50,86 +263,216 @@ class APIClient:
                      json_data: Dict[str, Any] = None,
                      params: Dict[str, Any] = None) -> bool:
         
+        # 재시도마다 다시 직렬화하지 않도록 한 번만 인코딩
+        body = _json_dumps(json_data) if json_data is not None else None
+        
         for attempt in range(self.max_retries):
             try:
-                self.logger.debug(f"Sending {method} request to {url} (attempt {attempt + 1})")
+                self.logger.debug("Sending %s request to %s (attempt %d)", method, url, attempt + 1)
                 
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=json_data,
-                    params=params,
-                    timeout=self.timeout
-                )
+                response = self._request(method, url, body, params)
                 
-                if response.status_code >= 200 and response.status_code < 300:
-                    self.logger.info(f"API request successful: {method} {url} -> {response.status_code}")
+                bucket = response.status_code // 100
+                if bucket == 2:
+                    # 성공 응답 본문은 사용하지 않지만, 읽지 않고 닫으면 keep-alive 연결이 끊기므로
+                    # 작은 본문은 끝까지 읽어 연결을 풀로 돌려보냄
+                    self._read_body_prefix(response)
+                    self.logger.info("API request successful: %s %s -> %d", method, url, response.status_code)
                     return True
                 else:
-                    error_msg = f"API request failed: {method} {url} -> {response.status_code}"
-                    try:
-                        error_detail = response.json()
-                        error_msg += f" - {error_detail}"
-                    except:
-                        error_msg += f" - {response.text[:200]}"
-                    
-                    self.logger.error(error_msg)
+                    error_detail = self._decode_error_body(self._read_body_prefix(response))
+                    self.logger.error("API request failed: %s %s -> %d - %s", method, url, response.status_code, error_detail)
                     
-                    if response.status_code >= 400 and response.status_code < 500:
-                        raise APIError(f"Client error {response.status_code}: {response.text}")
+                    if bucket == 4:
+                        raise APIError(f"Client error {response.status_code}: {error_detail}")
                     elif attempt == self.max_retries - 1:
-                        raise APIError(f"Server error {response.status_code}: {response.text}")
+                        raise APIError(f"Server error {response.status_code}: {error_detail}")
                 
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Request attempt {attempt + 1} failed: {e}"
-                self.logger.warning(error_msg)
+            except _UNRECOVERABLE_ERRORS as e:
+                # 재시도해도 복구되지 않는 오류
+                self.logger.error("Unrecoverable request error: %s", e)
+                raise APIError(f"API request failed: {e}")
+            
+            except _TRANSIENT_ERRORS as e:
+                self.logger.warning("Request attempt %d failed: %s", attempt + 1, e)
                 
                 if attempt == self.max_retries - 1:
                     raise APIError(f"API request failed after {self.max_retries} attempts: {e}")
-                
-                time.sleep(2 ** attempt)
             
             except APIError:
                 raise
             
             except Exception as e:
-                self.logger.error(f"Unexpected error during API request: {e}")
+                self.logger.error("Unexpected error during API request: %s", e)
                 if attempt == self.max_retries - 1:
                     raise APIError(f"Unexpected error: {e}")
+            
+            time.sleep(self._backoff_delay(attempt))
+        
+        return False
+    
+    async def _send_request_async(self,
+                                  method: str,
+                                  url: str,
+                                  json_data: Dict[str, Any] = None,
+                                  params: Dict[str, Any] = None) -> bool:
+        
+        session = await self._get_async_session()
+        body = _json_dumps(json_data) if json_data is not None else None
+        headers = JSON_HEADERS if body is not None else None
+        
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.debug("Sending async %s request to %s (attempt %d)", method, url, attempt + 1)
                 
-                time.sleep(2 ** attempt)
+                async with session.request(method, url, data=body, params=params, headers=headers) as response:
+                    bucket = response.status // 100
+                    if bucket == 2:
+                        self.logger.info("API request successful: %s %s -> %d", method, url, response.status)
+                        return True
+                    
+                    error_detail = self._decode_error_body(await response.content.read(ERROR_BODY_LIMIT))
+                    self.logger.error("API request failed: %s %s -> %d - %s", method, url, response.status, error_detail)
+                    
+                    if bucket == 4:
+                        raise APIError(f"Client error {response.status}: {error_detail}")
+                    elif attempt == self.max_retries - 1:
+                        raise APIError(f"Server error {response.status}: {error_detail}")
+            
+            except (aiohttp.ClientSSLError, aiohttp.InvalidURL) as e:
+                self.logger.error("Unrecoverable request error: %s", e)
+                raise APIError(f"API request failed: {e}")
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning("Request attempt %d failed: %s", attempt + 1, e)
+                
+                if attempt == self.max_retries - 1:
+                    raise APIError(f"API request failed after {self.max_retries} attempts: {e}")
+            
+            except APIError:
+                raise
+            
+            except Exception as e:
+                self.logger.error("Unexpected error during API request: %s", e)
+                if attempt == self.max_retries - 1:
+                    raise APIError(f"Unexpected error: {e}")
+            
+            await asyncio.sleep(self._backoff_delay(attempt))
         
         return False
     
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        # 캐시 키로 쓸 수 있도록 dict/list/set 파라미터 값을 해시 가능한 형태로 변환
+        if isinstance(value, dict):
+            return frozenset((k, cls._freeze(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(cls._freeze(v) for v in value)
+        return value
+    
+    def _store_get_cache(self, key: tuple, expiry: float, data: Any) -> None:
+        cache = self._get_cache
+        cache[key] = (expiry, data)
+        cache.move_to_end(key)
+        if len(cache) <= self._get_cache_size:
+            return
+        
+        # 가득 차면 만료된 항목을 먼저 지우고, 그래도 크면 가장 오래된 항목부터 제거
+        now = time.monotonic()
+        for stale in [k for k, (exp, _) in cache.items() if exp <= now]:
+            del cache[stale]
+        while len(cache) > self._get_cache_size:
+            cache.popitem(last=False)
+    
+    def _cached_get(self, url: str, params: Dict[str, Any] = None, ttl: float = None) -> Any:
+        ttl = self._health_ttl if ttl is None else ttl
+        try:
+            key = (url, self._freeze(params or {}))
+            hash(key)
+        except TypeError:
+            # 해시할 수 없는 파라미터 값은 캐시하지 않음
+            key = None
+        
+        if key is not None:
+            cached = self._get_cache.get(key)
+            if cached is not None:
+                if time.monotonic() < cached[0]:
+                    self._get_cache.move_to_end(key)
+                    return cached[1]
+                del self._get_cache[key]
+        
+        response = self._http.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        
+        if key is not None and self._get_cache_size > 0:
+            self._store_get_cache(key, time.monotonic() + ttl, data)
+        return data
+    
     def test_connection(self) -> bool:
+        if self._health_cache is not None:
+            checked_at, healthy = self._health_cache
+            if time.monotonic() - checked_at < self._health_ttl:
+                return healthy
+        
+        healthy = self._probe_health()
+        self._health_cache = (time.monotonic(), healthy)
+        return healthy
+    
+    def _probe_health(self) -> bool:
         try:
             test_url = f"{self.base_url}/health"
             
-            response = self.session.get(test_url, timeout=self.timeout)
+            response = self._http.get(test_url, timeout=self.timeout)
             
             if response.status_code == 200:
-                self.logger.info(f"API connection test successful: {test_url}")
+                self.logger.info("API connection test successful: %s", test_url)
                 return True
             else:
-                self.logger.warning(f"API connection test returned {response.status_code}")
+                self.logger.warning("API connection test returned %d", response.status_code)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"API connection test failed: {e}")
+        except _TRANSIENT_ERRORS as e:
+            self.logger.error("API connection test failed: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error during connection test: {e}")
+            self.logger.error("Unexpected error during connection test: %s", e)
             return False
     
     def close(self) -> None:
+        if self._buffer:
+            failed = self.flush()
+            if failed:
+                self.logger.error("%d buffered file events were not sent", len(failed))
+        
+        if self.client is not None:
+            self.client.close()
+        
+        # 공유 커넥션 풀은 다른 인스턴스가 계속 사용하므로 닫지 않음
+        # (Session.close()는 마운트된 어댑터까지 닫음)
+        if self.shared_pool:
+            return
         try:
             self.session.close()
             self.logger.debug("API session closed")
         except Exception as e:
-            self.logger.warning(f"Error closing API session: {e}")
+            self.logger.warning("Error closing API session: %s", e)
+    
+    async def aclose(self) -> None:
+        self.close()
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+            self.logger.debug("API async session closed")
+        self._async_session = None
     
     def update_headers(self, headers: Dict[str, str]) -> None:
         self.session.headers.update(headers)
+        if self.client is not None:
+            self.client.headers.update(headers)
+        if self._async_session is not None and not self._async_session.closed:
+            self._async_session.headers.update(headers)
         self.logger.info("API headers updated")
     
     def get_session_info(self) -> Dict[str, Any]:
@@ -138,5 +481,6 @@ class APIClient:
             "endpoints": self.endpoints,
             "timeout": self.timeout,
             "max_retries": self.max_retries,
+            "http2": self.client is not None,
             "headers": dict(self.session.headers)
         }
\ No newline at end of file
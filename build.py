@@ -5,12 +5,18 @@ PyInstaller를 사용하여 단일 실행 파일을 생성합니다.
 크로스 플랫폼 빌드를 지원합니다.
 """
 
+import shutil
 import subprocess
 import sys
 import platform
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# 프로젝트 루트 디렉터리
+PROJECT_DIR = Path(__file__).resolve().parent
+
 def get_platform_info():
     """현재 플랫폼 정보를 반환"""
     system = platform.system().lower()
@@ -34,7 +40,7 @@ def get_platform_info():
     else:
         return system, machine
 
-def build_executable(target_platform=None):
+def build_executable(target_platform=None, verbose=False):
     """실행 파일을 빌드합니다."""
     print("🔨 웹 크롤러 실행 파일 빌드 시작...")
     
@@ -46,7 +52,7 @@ def build_executable(target_platform=None):
         print(f"🎯 타겟 플랫폼: {target_platform}")
     
     # 현재 디렉터리
-    current_dir = Path(__file__).parent
+    current_dir = PROJECT_DIR
     main_script = current_dir / "main.py"
     
     if not main_script.exists():
@@ -67,7 +73,6 @@ def build_executable(target_platform=None):
         f"--paths={current_dir}",       # 현재 디렉터리를 Python 경로에 추가
         "--hidden-import=requests",     # 숨겨진 import 처리
         "--hidden-import=aiohttp",
-        "--hidden-import=aiofiles",
         "--hidden-import=beautifulsoup4",
         "--hidden-import=lxml",
         "--hidden-import=tqdm",
@@ -77,6 +82,7 @@ def build_executable(target_platform=None):
         "--hidden-import=psutil",
         "--hidden-import=PySocks",
         "--hidden-import=yaml",         # PyYAML
+        "--hidden-import=yaml._yaml",   # libyaml C 바인딩 (CSafeLoader/CSafeDumper)
         "--hidden-import=paramiko",     # SSH/SFTP 라이브러리
         "--hidden-import=web_crawler",  # 웹 크롤러 모듈
         "--hidden-import=link_detector",  # 링크 검출기 모듈
@@ -89,24 +95,21 @@ def build_executable(target_platform=None):
         "--collect-all=stemquests",     # stemquests 전체 수집
         "--collect-all=stem",           # stem 전체 수집
         "--noupx",                      # UPX 압축 비활성화 (호환성)
+        # INFO 로그는 수백 줄이므로 상세 출력 모드에서만 표시
+        f"--log-level={'INFO' if verbose else 'WARN'}",
     ]
 
+    # --add-data 구분자 (Windows는 ';', 그 외는 ':')
+    is_windows = current_os == "windows" or (target_platform or "").startswith("windows")
+    sep = ";" if is_windows else ":"
+
     # 로컬 패키지들을 데이터로 추가
-    for package_name in ['config', 'ftp', 'api']:
-        package_dir = current_dir / package_name
-        if package_dir.exists():
-            if current_os == "windows" or (target_platform and target_platform.startswith("windows")):
-                cmd.append(f"--add-data={package_name};{package_name}")
-            else:
-                cmd.append(f"--add-data={package_name}:{package_name}")
+    cmd += [f"--add-data={name}{sep}{name}" for name in ['config', 'ftp', 'api']
+            if (current_dir / name).exists()]
 
     # 설정 파일 포함 (있는 경우)
-    config_file = current_dir / "config.yml"
-    if config_file.exists():
-        if current_os == "windows" or (target_platform and target_platform.startswith("windows")):
-            cmd.append("--add-data=config.yml;.")
-        else:
-            cmd.append("--add-data=config.yml:.")
+    if (current_dir / "config.yml").exists():
+        cmd.append(f"--add-data=config.yml{sep}.")
     
     # Linux 특화 설정
     if target_platform == "linux" or current_os == "linux":
@@ -119,7 +122,16 @@ def build_executable(target_platform=None):
     
     try:
         print("📦 PyInstaller 실행 중...")
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # 출력은 줄 단위로 바로 표시하고, 실패 진단용으로 마지막 200줄만 보관
+        output_tail = deque(maxlen=200)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        for line in proc.stdout:
+            print(line, end='')
+            output_tail.append(line)
+        
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=''.join(output_tail))
         print("✅ 빌드 성공!")
         
         # 빌드된 파일 위치 표시
@@ -133,9 +145,9 @@ def build_executable(target_platform=None):
         return True
         
     except subprocess.CalledProcessError as e:
-        print("❌ 빌드 실패!")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+        print(f"❌ 빌드 실패! (종료 코드: {e.returncode})")
+        print("--- PyInstaller 마지막 출력 ---")
+        print(e.output, end='')
         return False
     except FileNotFoundError:
         print("❌ PyInstaller를 찾을 수 없습니다. 가상환경이 활성화되어 있는지 확인하세요.")
@@ -145,7 +157,7 @@ def clean_build_files():
     """빌드 임시 파일들을 정리합니다."""
     print("🧹 빌드 임시 파일 정리 중...")
     
-    current_dir = Path(__file__).parent
+    current_dir = PROJECT_DIR
     
     # 정리할 디렉터리/파일들
     cleanup_paths = [
@@ -154,15 +166,20 @@ def clean_build_files():
         current_dir / "webcrawler.spec"
     ]
     
-    for path in cleanup_paths:
-        if path.exists():
-            if path.is_dir():
-                import shutil
-                shutil.rmtree(path)
-                print(f"🗑️  디렉터리 삭제: {path}")
-            else:
-                path.unlink()
-                print(f"🗑️  파일 삭제: {path}")
+    existing_paths = [path for path in cleanup_paths if path.exists()]
+    
+    # 디렉터리 트리 삭제는 I/O 대기가 대부분이므로 여러 경로를 동시에 처리
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for message in executor.map(_remove_path, existing_paths):
+            print(message)
+
+def _remove_path(path):
+    """파일 또는 디렉터리를 삭제하고 출력할 메시지를 반환"""
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+        return f"🗑️  디렉터리 삭제: {path}"
+    path.unlink()
+    return f"🗑️  파일 삭제: {path}"
 
 def main():
     """메인 함수"""
@@ -207,7 +224,7 @@ def main():
     print("=" * 60)
     
     # 빌드 실행
-    success = build_executable(args.platform)
+    success = build_executable(args.platform, verbose=args.verbose)
     
     if success:
         current_os, current_arch = get_platform_info()
@@ -1,11 +1,49 @@
 import yaml
 import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
+# libyaml C 바인딩이 있으면 사용 (순수 파이썬 로더보다 훨씬 빠름)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# 기본 설정 파일 경로 (import 시 한 번만 계산)
+_DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / 'config' / 'config.yaml'
+
+# 섹션이 없을 때 반환하는 빈 읽기 전용 설정
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(config: Dict[str, Any]) -> Mapping[str, Any]:
+    """중첩된 dict까지 읽기 전용 뷰로 변환 (밖에서 수정하면 _flat 색인과 어긋나므로)"""
+    return MappingProxyType({key: _freeze(value) if isinstance(value, dict) else value
+                             for key, value in config.items()})
+
+
+def _flatten(config: Mapping[str, Any], prefix: str, out: Dict[str, Any]) -> None:
+    """중첩 설정을 'a.b.c' 형태의 키로 펼쳐서 out에 채움"""
+    for key, value in config.items():
+        if not isinstance(key, str):
+            continue
+        flat_key = f"{prefix}{key}"
+        out[flat_key] = value
+        if isinstance(value, Mapping):
+            _flatten(value, f"{flat_key}.", out)
+
+
 class ConfigManager:
     _instance: Optional['ConfigManager'] = None
     _config: Dict[str, Any] = {}
+    _flat: Dict[str, Any] = {}
+    # 밖으로 내보내는 설정은 읽기 전용 뷰 (수정은 update_config로만)
+    _view: Mapping[str, Any] = _EMPTY
+    
+    # validate_config에서 확인하는 필수 섹션 / 필수 키
+    REQUIRED_SECTIONS = frozenset({'crawler', 'ftp', 'api'})
+    REQUIRED_KEYS = ('monitoring.watch_directory', 'ftp.host', 'api.base_url')
     
     def __new__(cls) -> 'ConfigManager':
         if cls._instance is None:
@@ -15,32 +53,53 @@ class ConfigManager:
     def __init__(self):
         if not hasattr(self, '_initialized'):
             self._config_file = None
+            # 설정 파일 경로 -> (mtime, size, 파싱된 설정)
+            self._cache: Dict[str, Tuple[float, int, Dict[str, Any]]] = {}
             self._initialized = True
     
     def load_config(self, config_file: str = None) -> Dict[str, Any]:
         if config_file is None:
-            config_file = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                'config', 'config.yaml'
-            )
+            config_file = str(_DEFAULT_CONFIG)
         
         self._config_file = config_file
         
-        if not os.path.exists(config_file):
+        if not Path(config_file).is_file():
             raise FileNotFoundError(f"Config file not found: {config_file}")
         
+        # 파일이 바뀌지 않았으면 이전에 파싱한 결과를 그대로 사용
+        st = os.stat(config_file)
+        cached = self._cache.get(config_file)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            if self._config is not cached[2]:
+                self._config = cached[2]
+                self._reindex()
+            return self._view
+        
         try:
             with open(config_file, 'r', encoding='utf-8') as file:
-                self._config = yaml.safe_load(file)
-            return self._config
+                self._config = yaml.load(file, Loader=SafeLoader)
+            self._reindex()
+            self._cache[config_file] = (st.st_mtime, st.st_size, self._config)
+            return self._view
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to load config: {e}")
     
+    def _reindex(self) -> None:
+        self._flat = {}
+        if isinstance(self._config, dict):
+            self._view = _freeze(self._config)
+            _flatten(self._view, '', self._flat)
+        else:
+            self._view = self._config
+    
     def get(self, key: str, default: Any = None) -> Any:
+        if key in self._flat:
+            return self._flat[key]
+        
         keys = key.split('.')
-        value = self._config
+        value = self._view
         
         try:
             for k in keys:
@@ -49,14 +108,15 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
     
-    def get_crawler_config(self) -> Dict[str, Any]:
-        return self.get('crawler', {})
+    # 섹션 설정은 읽기 전용 뷰로 반환 (복사 없이 공유, 수정이 필요하면 dict(cfg))
+    def get_crawler_config(self) -> Mapping[str, Any]:
+        return self.get('crawler', _EMPTY)
     
-    def get_ftp_config(self) -> Dict[str, Any]:
-        return self.get('ftp', {})
+    def get_ftp_config(self) -> Mapping[str, Any]:
+        return self.get('ftp', _EMPTY)
     
-    def get_api_config(self) -> Dict[str, Any]:
-        return self.get('api', {})
+    def get_api_config(self) -> Mapping[str, Any]:
+        return self.get('api', _EMPTY)
 
 
     def update_config(self, key: str, value: Any) -> None:
@@ -69,6 +129,10 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        self._reindex()
+        
+        # 메모리상 설정이 파일과 달라졌으므로 다음 load_config에서 다시 읽음
+        self._cache.pop(self._config_file, None)
     
     def save_config(self, config_file: str = None) -> None:
         if config_file is None:
@@ -80,27 +144,18 @@ class ConfigManager:
         try:
             os.makedirs(os.path.dirname(config_file), exist_ok=True)
             with open(config_file, 'w', encoding='utf-8') as file:
-                yaml.safe_dump(self._config, file, default_flow_style=False, 
-                             ensure_ascii=False, indent=2)
+                yaml.dump(self._config, file, Dumper=SafeDumper, default_flow_style=False,
+                          allow_unicode=True, indent=2)
         except Exception as e:
             raise RuntimeError(f"Failed to save config: {e}")
     
     def validate_config(self) -> bool:
-        required_sections = ['crawler', 'ftp', 'api']
-        for section in required_sections:
-            if section not in self._config:
-                raise ValueError(f"Missing required config section: {section}")
-        
-        monitoring = self.get_monitoring_config()
-        if not monitoring.get('watch_directory'):
-            raise ValueError("Missing required config: monitoring.watch_directory")
-        
-        ftp = self.get_ftp_config()
-        if not ftp.get('host'):
-            raise ValueError("Missing required config: ftp.host")
+        missing = self.REQUIRED_SECTIONS - self._config.keys()
+        if missing:
+            raise ValueError(f"Missing required config section: {', '.join(sorted(missing))}")
         
-        api = self.get_api_config()
-        if not api.get('base_url'):
-            raise ValueError("Missing required config: api.base_url")
+        for key in self.REQUIRED_KEYS:
+            if not self.get(key):
+                raise ValueError(f"Missing required config: {key}")
         
         return True
\ No newline at end of file
@@ -13,17 +13,16 @@ async def example_basic_crawling():
     print("=== 기본 크롤링 예제 ===")
     
     # 간단한 크롤러 생성
-    crawler = WebCrawler()
-    
-    # 웹사이트 크롤링 (문서와 이미지만)
-    result = await crawler.crawl_and_download(
-        urls=["https://example.com"],
-        file_types=["documents", "images"],
-        output_dir="./example_downloads"
-    )
-    
-    print(f"발견된 파일: {result['stats']['files_found']}개")
-    print(f"다운로드된 파일: {result['stats']['files_downloaded']}개")
+    async with WebCrawler() as crawler:
+        # 웹사이트 크롤링 (문서와 이미지만)
+        result = await crawler.crawl_and_download(
+            urls=["https://example.com"],
+            file_types=["documents", "images"],
+            output_dir="./example_downloads"
+        )
+        
+        print(f"발견된 파일: {result['stats']['files_found']}개")
+        print(f"다운로드된 파일: {result['stats']['files_downloaded']}개")
 
 
 async def example_custom_config():
@@ -40,59 +39,56 @@ async def example_custom_config():
         'delay_between_requests': 0.5
     }
     
-    crawler = WebCrawler(config)
-    
-    # 크롤링 실행
-    result = await crawler.crawl_and_download(
-        urls=["https://example.com/downloads"]
-    )
-    
-    print("사용자 정의 설정으로 크롤링 완료")
+    async with WebCrawler(config) as crawler:
+        # 크롤링 실행
+        result = await crawler.crawl_and_download(
+            urls=["https://example.com/downloads"]
+        )
+        
+        print("사용자 정의 설정으로 크롤링 완료")
 
 
 async def example_find_only():
     """파일 링크만 찾기 예제"""
     print("\n=== 파일 링크 탐지 예제 ===")
     
-    crawler = WebCrawler()
-    
-    # 파일 링크만 찾기 (다운로드하지 않음)
-    file_links = await crawler.find_files_only(
-        urls=["https://example.com"],
-        file_types=["documents", "images", "videos"]
-    )
-    
-    print("발견된 파일 링크:")
-    for file_type, links in file_links.items():
-        if links:
-            print(f"\n{file_type}: {len(links)}개")
-            for link in links[:3]:  # 처음 3개만 표시
-                print(f"  - {link}")
-            if len(links) > 3:
-                print(f"  ... 및 {len(links) - 3}개 더")
+    async with WebCrawler() as crawler:
+        # 파일 링크만 찾기 (다운로드하지 않음)
+        file_links = await crawler.find_files_only(
+            urls=["https://example.com"],
+            file_types=["documents", "images", "videos"]
+        )
+        
+        print("발견된 파일 링크:")
+        for file_type, links in file_links.items():
+            if links:
+                print(f"\n{file_type}: {len(links)}개")
+                for link in links[:3]:  # 처음 3개만 표시
+                    print(f"  - {link}")
+                if len(links) > 3:
+                    print(f"  ... 및 {len(links) - 3}개 더")
 
 
 async def example_download_from_list():
     """URL 목록에서 직접 다운로드"""
     print("\n=== URL 목록 다운로드 예제 ===")
     
-    crawler = WebCrawler()
-    
-    # 다운로드할 파일 URL 목록
-    file_urls = [
-        "https://example.com/file1.pdf",
-        "https://example.com/file2.jpg",
-        "https://example.com/file3.zip"
-    ]
-    
-    # 직접 다운로드
-    results = await crawler.download_files_from_list(
-        file_urls=file_urls,
-        output_dir="./direct_downloads"
-    )
-    
-    successful = [r for r in results if r['success']]
-    print(f"다운로드 완료: {len(successful)}/{len(file_urls)}개")
+    async with WebCrawler() as crawler:
+        # 다운로드할 파일 URL 목록
+        file_urls = [
+            "https://example.com/file1.pdf",
+            "https://example.com/file2.jpg",
+            "https://example.com/file3.zip"
+        ]
+        
+        # 직접 다운로드
+        results = await crawler.download_files_from_list(
+            file_urls=file_urls,
+            output_dir="./direct_downloads"
+        )
+        
+        successful = [r for r in results if r['success']]
+        print(f"다운로드 완료: {len(successful)}/{len(file_urls)}개")
 
 
 def example_sync_crawling():
@@ -116,7 +112,11 @@ def example_config_file():
     # 설정 파일에서 크롤러 생성
     try:
         crawler = create_crawler_from_config_file("config.json")
-        
+    except Exception as e:
+        print(f"설정 파일 로드 실패: {e}")
+        return
+    
+    try:
         # 동기 방식으로 실행
         result = crawler.crawl_and_download_sync(
             urls=["https://example.com"]
@@ -125,7 +125,10 @@ def example_config_file():
         print("설정 파일 기반 크롤링 완료")
         
     except Exception as e:
-        print(f"설정 파일 로드 실패: {e}")
+        print(f"크롤링 실패: {e}")
+    finally:
+        # 크롤러가 공유하는 HTTP 연결 풀 정리
+        asyncio.run(crawler.aclose())
 
 
 def example_file_types():
@@ -157,25 +160,24 @@ async def example_advanced_usage():
         'log_level': 'DEBUG'
     }
     
-    crawler = WebCrawler(config)
-    
-    # 사용자 정의 확장자 추가
-    crawler.add_custom_extensions(['log', 'cfg', 'ini'])
-    
-    # 여러 웹사이트 크롤링
-    urls = [
-        "https://example.com/downloads",
-        "https://example.org/files",
-        "https://example.net/resources"
-    ]
-    
-    result = await crawler.crawl_and_download(
-        urls=urls,
-        file_types=["documents", "archives", "data"],
-        output_dir="./multi_site_downloads"
-    )
-    
-    print("다중 사이트 크롤링 완료")
+    async with WebCrawler(config) as crawler:
+        # 사용자 정의 확장자 추가
+        crawler.add_custom_extensions(['log', 'cfg', 'ini'])
+        
+        # 여러 웹사이트 크롤링
+        urls = [
+            "https://example.com/downloads",
+            "https://example.org/files",
+            "https://example.net/resources"
+        ]
+        
+        result = await crawler.crawl_and_download(
+            urls=urls,
+            file_types=["documents", "archives", "data"],
+            output_dir="./multi_site_downloads"
+        )
+        
+        print("다중 사이트 크롤링 완료")
 
 
 async def main():
@@ -208,8 +210,8 @@ async def main():
         print("   python main.py https://example.com -t documents images")
         print("\n2. 코드에서 직접 사용:")
         print("   from web_crawler import WebCrawler")
-        print("   crawler = WebCrawler()")
-        print("   result = await crawler.crawl_and_download(['https://example.com'])")
+        print("   async with WebCrawler() as crawler:")
+        print("       result = await crawler.crawl_and_download(['https://example.com'])")
         
     except Exception as e:
         print(f"❌ 예제 실행 중 오류: {e}")
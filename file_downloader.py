@@ -4,29 +4,127 @@
 """
 
 import os
+import sys
+import json
 import asyncio
 import aiohttp
-import aiofiles
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from urllib.parse import urlparse, unquote
-from typing import List, Dict, Callable, Any
+from typing import List, Dict, Callable, Any, Optional, Tuple, Iterator, AsyncIterator, AsyncIterable, Union
 import logging
 import hashlib
 import time
+import itertools
+from email.utils import parsedate_to_datetime
 from tqdm.asyncio import tqdm
 import mimetypes
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# aiohttp 읽기 버퍼 크기 (기본 64KiB는 빠른 링크에서 "Chunk too big" 오류 및 처리량 저하 유발)
+READ_BUFSIZE = 10 * 1024 * 1024
+
+# 큰 파일은 청크를 키워서 루프 반복/쓰기 호출 횟수를 줄임
+LARGE_FILE_THRESHOLD = 8 * 1024 * 1024
+LARGE_CHUNK_SIZE = 256 * 1024
+
+# 큰 파일을 Range 요청으로 나누어 동시에 받을 때의 기본값
+PARALLEL_SEGMENTS = 4
+RANGE_THRESHOLD = 16 * 1024 * 1024
+
+# 청크를 모아서 이 크기 단위로 한 번에 파일에 씀 (쓰기마다 스레드 전환하지 않도록)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# os.pwritev 한 번에 넘길 최대 버퍼 수 (리눅스 IOV_MAX)
+IOV_MAX = 1024
+
+# 진행상황 콜백은 이 바이트 수 또는 시간 간격마다 한 번만 호출
+PROGRESS_REPORT_BYTES = 256 * 1024
+PROGRESS_REPORT_INTERVAL = 0.05
+
+# 429 응답의 Retry-After를 따를 때 최대 대기 시간 (초)
+MAX_RETRY_AFTER = 300
+
+# URL별 ETag/Last-Modified를 저장하는 파일 (download_dir 안에 생성)
+ETAG_CACHE_FILE = '.etag_cache.json'
+
+# 파일 다운로드 요청은 압축하지 않은 원본 바이트로 받음
+# (압축 응답이면 Range 오프셋이 압축된 스트림 기준이라 이어받기/구간 다운로드 결과가 깨짐)
+IDENTITY_ENCODING = {'Accept-Encoding': 'identity'}
+
+
+def install_uvloop() -> bool:
+    """
+    uvloop이 설치되어 있으면 asyncio 이벤트 루프 정책을 uvloop으로 교체
+    
+    이미 실행 중인 루프에는 적용되지 않으므로 asyncio.run() 전에 호출해야 합니다.
+    
+    Returns:
+        적용 여부
+    """
+    if uvloop is None or sys.platform == 'win32':
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class _RangeNotSupported(Exception):
+    """서버가 Range 요청에 206이 아닌 응답을 보냄"""
+
 
 class FileDownloader:
     """파일 다운로드를 관리하는 클래스"""
     
+    # 파일명에 사용할 수 없는 문자를 '_'로 바꾸는 변환 테이블
+    _SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    
+    # 자주 쓰이는 Content-Type의 확장자 (mimetypes 조회 전에 먼저 확인)
+    _CT_EXT = {
+        'application/pdf': '.pdf',
+        'application/msword': '.doc',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+        'application/vnd.ms-excel': '.xls',
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': '.xlsx',
+        'application/zip': '.zip',
+        'application/x-7z-compressed': '.7z',
+        'application/x-rar-compressed': '.rar',
+        'application/gzip': '.gz',
+        'application/x-tar': '.tar',
+        'application/json': '.json',
+        'application/xml': '.xml',
+        'text/xml': '.xml',
+        'text/csv': '.csv',
+        'text/plain': '.txt',
+        'text/html': '.html',
+        'image/jpeg': '.jpg',
+        'image/png': '.png',
+        'image/gif': '.gif',
+        'image/webp': '.webp',
+        'image/svg+xml': '.svg',
+        'video/mp4': '.mp4',
+        'video/webm': '.webm',
+        'audio/mpeg': '.mp3',
+        'audio/wav': '.wav',
+        'audio/ogg': '.ogg',
+    }
+    
     def __init__(self, 
                  download_dir: str = "./downloads",
                  max_concurrent: int = 5,
-                 chunk_size: int = 8192,
+                 chunk_size: int = 65536,
                  timeout: int = 30,
-                 retry_count: int = 3):
+                 retry_count: int = 3,
+                 parallel_segments: int = PARALLEL_SEGMENTS,
+                 range_threshold: int = RANGE_THRESHOLD,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 max_concurrency: Optional[int] = None,
+                 sync_session: Optional[requests.Session] = None):
         """
         FileDownloader 초기화
         
@@ -36,30 +134,64 @@ class FileDownloader:
             chunk_size: 청크 크기 (바이트)
             timeout: 타임아웃 (초)
             retry_count: 재시도 횟수
+            parallel_segments: 큰 파일을 나누어 받을 Range 요청 수 (1이면 사용 안함)
+            range_threshold: Range 분할 다운로드를 사용할 최소 파일 크기 (바이트)
+            session: 다른 컴포넌트와 공유할 aiohttp 세션 (선택사항, 종료는 호출자가 담당)
+            max_concurrency: set_concurrency로 늘릴 수 있는 동시 다운로드 수 상한 (None이면 max_concurrent로 고정)
+            sync_session: 동기 다운로드에 사용할 공유 requests 세션 (선택사항, 종료는 호출자가 담당)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         
         self.max_concurrent = max_concurrent
+        
+        # 현재 동시 다운로드 수 (download_files 실행 중에도 set_concurrency로 조정 가능)
+        self.concurrency = max_concurrent
+        self.max_concurrency = max(max_concurrency or max_concurrent, max_concurrent)
+        self._slot_condition: Optional[asyncio.Condition] = None
+        
+        # 지금까지 받은 전체 바이트 수 (처리량 측정용)
+        self.bytes_received = 0
+        
+        # 시작했지만 끝나지 않은 다운로드 수 (동시 실행 자리를 기다리는 것 포함)
+        self.in_flight = 0
+        
         self.chunk_size = chunk_size
         self.timeout = timeout
         self.retry_count = retry_count
+        self.parallel_segments = parallel_segments
+        self.range_threshold = range_threshold
         
         self.logger = logging.getLogger(__name__)
-        self.session = None
+        
+        # download_files 호출 간에 재사용하는 HTTP 세션 (커넥션 풀/쿠키 공유)
+        # 프로세스당 FileDownloader 인스턴스 하나를 재사용하고, 끝나면 aclose()를 호출하세요.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shared_session = session
+        self._shared_sync_session = sync_session
         
         # 다운로드 통계
         self.stats = {
             'total_files': 0,
             'successful_downloads': 0,
             'failed_downloads': 0,
+            'skipped_downloads': 0,
             'total_size': 0,
             'start_time': None,
             'end_time': None
         }
         
-        # 파일 중복 체크를 위한 해시 저장
-        self.downloaded_hashes = set()
+        # 파일 중복 체크용: (종류, 크기, ETag 또는 MD5) -> 저장된 파일 경로
+        self.downloaded_hashes: Dict[Tuple[str, int, str], str] = {}
+        
+        # 파일명별 다음 접미사 번호 (동시 다운로드끼리 같은 경로를 고르지 않도록 예약)
+        self._reserved_names: Dict[Path, Iterator[int]] = {}
+        
+        # 조건부 GET용 캐시: URL -> (ETag, Last-Modified, 저장된 파일 경로)
+        self._etag_cache: Dict[str, Tuple[str, str, str]] = {}
+        self._etag_cache_dir: Optional[Path] = None
+        self._etag_cache_dirty = False
     
     def get_filename_from_url(self, url: str, content_disposition: str = None) -> str:
         """
@@ -104,7 +236,7 @@ class FileDownloader:
             
             # 파일명이 없거나 의미없는 경우 URL 해시로 생성
             if not filename or filename == '/':
-                url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+                url_hash = hashlib.blake2s(url.encode(), digest_size=4).hexdigest()
                 filename = f"file_{url_hash}"
         
         # 안전한 파일명으로 변환
@@ -123,9 +255,7 @@ class FileDownloader:
             안전한 파일명
         """
         # 위험한 문자 제거
-        unsafe_chars = '<>:"/\\|?*'
-        for char in unsafe_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(self._SANITIZE_TABLE)
         
         # 파일명 길이 제한
         if len(filename) > 200:
@@ -134,6 +264,33 @@ class FileDownloader:
         
         return filename
     
+    def _reserve_path(self, filename: str) -> Path:
+        """
+        중복되지 않는 저장 경로를 골라 빈 파일로 미리 생성
+        
+        O_EXCL로 생성하므로 동시에 같은 이름을 고른 다운로드가 같은 파일에 쓰지 않으며,
+        이름별 번호를 기억해 두어 이미 사용한 접미사는 다시 시도하지 않습니다.
+        """
+        base_name, ext = os.path.splitext(filename)
+        counter = self._reserved_names.setdefault(self.download_dir / filename, itertools.count())
+        
+        while True:
+            number = next(counter)
+            candidate = filename if number == 0 else f"{base_name}_{number}{ext}"
+            file_path = self.download_dir / candidate
+            try:
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o644)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            return file_path
+    
+    def _chunk_size_for(self, total_size: int) -> int:
+        """파일 크기에 맞는 청크 크기 반환"""
+        if total_size > LARGE_FILE_THRESHOLD:
+            return max(self.chunk_size, LARGE_CHUNK_SIZE)
+        return self.chunk_size
+    
     def get_file_extension_from_content_type(self, content_type: str) -> str:
         """
         Content-Type에서 파일 확장자 추정
@@ -144,13 +301,16 @@ class FileDownloader:
         Returns:
             파일 확장자
         """
-        extension = mimetypes.guess_extension(content_type.split(';')[0])
-        return extension or ''
+        mime_type = content_type.split(';', 1)[0].strip().lower()
+        return self._CT_EXT.get(mime_type) or mimetypes.guess_extension(mime_type) or ''
     
     async def get_file_info(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
         """
         파일 정보를 가져옴 (HEAD 요청)
         
+        download_file은 GET 응답 헤더를 직접 사용하므로, 다운로드 전에
+        크기 등을 미리 확인해야 할 때만 사용합니다.
+        
         Args:
             session: aiohttp 세션
             url: 파일 URL
@@ -203,58 +363,136 @@ class FileDownloader:
         result = {
             'url': url,
             'success': False,
+            'skipped': False,
             'filename': '',
             'file_path': '',
             'size': 0,
             'error': None
         }
         
+        self._load_etag_cache()
+        conditional_headers, cached_path = self._conditional_headers(url)
+        
+        # 재시도 시 이어받기를 위해 시도 간에 유지되는 상태
+        file_path = None
+        resumable = False
+        etag = ''
+        last_modified = ''
+        
         for attempt in range(self.retry_count + 1):
             try:
-                # 파일 정보 가져오기
-                file_info = await self.get_file_info(session, url)
+                # 이전 시도에서 순차 기록하던 파일이 남아 있으면 받은 부분 이후만 요청
+                resume_from = 0
+                if resumable and file_path.exists():
+                    resume_from = file_path.stat().st_size
                 
-                if file_info['status_code'] not in [200, 206]:
-                    result['error'] = f"HTTP {file_info['status_code']}"
-                    continue
+                if resume_from:
+                    headers = {'Range': f'bytes={resume_from}-', **IDENTITY_ENCODING}
+                    if etag:
+                        # 그 사이 파일이 바뀌었으면 서버가 200으로 전체를 보냄
+                        headers['If-Range'] = etag
+                else:
+                    # 나중에 이어받거나 구간으로 나누어 받을 수 있으므로 처음 요청도 원본 바이트로 받음
+                    headers = {**conditional_headers, **IDENTITY_ENCODING}
                 
-                # 파일명 결정
-                if not filename:
-                    filename = self.get_filename_from_url(url, file_info['content_disposition'])
+                # 파일 다운로드 (별도 HEAD 요청 없이 GET 응답 헤더에서 파일 정보 확인)
+                async with session.get(url, headers=headers,
+                                       timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                       allow_redirects=True, read_bufsize=READ_BUFSIZE) as response:
+                    # 이전에 받은 파일과 동일 (304 Not Modified)
+                    if response.status == 304 and cached_path and not resume_from:
+                        self.logger.info(f"변경 없음, 다운로드 건너뜀: {url}")
+                        return self._mark_skipped(result, cached_path)
+                    
+                    if response.status == 429:
+                        # 요청 제한: 서버가 알려준 시간만큼 기다린 뒤 재시도
+                        result['error'] = "HTTP 429"
+                        delay = self._retry_after_delay(response, 2 ** attempt)
+                        response.release()
+                        if attempt < self.retry_count:
+                            self.logger.warning(f"요청 제한(429) {url}, {delay:.1f}초 후 재시도")
+                            await asyncio.sleep(delay)
+                        continue
                     
-                    # 확장자가 없으면 Content-Type에서 추정
-                    if not os.path.splitext(filename)[1] and file_info['content_type']:
-                        ext = self.get_file_extension_from_content_type(file_info['content_type'])
-                        if ext:
-                            filename += ext
-                
-                # 파일 경로 설정
-                file_path = self.download_dir / filename
-                
-                # 중복 파일명 처리
-                counter = 1
-                base_name, ext = os.path.splitext(filename)
-                while file_path.exists():
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    file_path = self.download_dir / new_filename
-                    counter += 1
-                
-                # 파일 다운로드
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout), allow_redirects=True) as response:
                     if response.status not in [200, 206]:
                         result['error'] = f"HTTP {response.status}"
+                        if resume_from:
+                            # 이어받기 요청이 거부되면 다음 시도는 처음부터 받음
+                            resumable = False
                         continue
                     
+                    content_disposition = response.headers.get('Content-Disposition', '')
+                    content_type = response.headers.get('Content-Type', '')
                     total_size = int(response.headers.get('Content-Length', 0))
-                    downloaded_size = 0
                     
-                    async with aiofiles.open(file_path, 'wb') as file:
-                        async for chunk in response.content.iter_chunked(self.chunk_size):
-                            await file.write(chunk)
-                            downloaded_size += len(chunk)
-                            
-                            if progress_callback:
-                                progress_callback(downloaded_size, total_size)
+                    if resume_from:
+                        if response.status == 206:
+                            content_range = self._parse_content_range(response.headers.get('Content-Range', ''))
+                            if not content_range or content_range[0] != resume_from:
+                                resumable = False
+                                raise aiohttp.ClientPayloadError(
+                                    f"Content-Range 불일치: {response.headers.get('Content-Range', '')}"
+                                )
+                            total_size = content_range[2] or resume_from + total_size
+                        else:
+                            # 200이면 서버가 전체를 다시 보내므로 파일을 비우고 처음부터 기록
+                            self.logger.info(f"이어받기 미지원, 처음부터 다시 다운로드: {url}")
+                            resume_from = 0
+                    
+                    if not resume_from:
+                        etag = response.headers.get('ETag', '')
+                        last_modified = response.headers.get('Last-Modified', '')
+                        
+                        # 같은 크기/ETag의 파일을 이미 받았으면 본문을 읽지 않고 건너뜀
+                        duplicate = self._find_duplicate(('etag', total_size, etag)) if etag and total_size else None
+                        if duplicate is not None and duplicate != file_path:
+                            response.close()
+                            self._remove_if_empty(file_path)
+                            self.logger.info(f"중복 파일, 다운로드 건너뜀: {url} -> {duplicate.name}")
+                            return self._mark_skipped(result, duplicate)
+                    
+                    # 파일명 결정
+                    if not filename:
+                        filename = self.get_filename_from_url(url, content_disposition)
+                        
+                        # 확장자가 없으면 Content-Type에서 추정
+                        if not os.path.splitext(filename)[1] and content_type:
+                            ext = self.get_file_extension_from_content_type(content_type)
+                            if ext:
+                                filename += ext
+                    
+                    # 파일 경로 설정 (재시도에서는 이전 시도의 파일을 그대로 사용)
+                    if file_path is None:
+                        file_path = self._reserve_path(filename)
+                    
+                    # 큰 파일이고 서버가 Range를 지원하면 여러 구간으로 나누어 동시에 다운로드
+                    hasher = None
+                    if not resume_from and self._can_split(response, total_size):
+                        resumable = False
+                        response.close()
+                        downloaded_size = await self._download_ranges(
+                            session, url, file_path, total_size, progress_callback
+                        )
+                    else:
+                        resumable = True
+                        # ETag가 없으면 기록하면서 MD5를 계산해 중복 판별에 사용 (이어받기는 앞부분이 없어 제외)
+                        if not etag and not resume_from:
+                            hasher = hashlib.md5(usedforsecurity=False)
+                        downloaded_size = await self._stream_to_file(
+                            response, file_path, total_size, progress_callback, resume_from, hasher
+                        )
+                
+                if etag and total_size:
+                    self.downloaded_hashes[('etag', total_size, etag)] = str(file_path)
+                elif hasher is not None:
+                    dedup_key = ('md5', downloaded_size, hasher.hexdigest())
+                    duplicate = self._find_duplicate(dedup_key)
+                    if duplicate is not None and duplicate != file_path:
+                        # 내용이 같은 파일이 이미 있으므로 방금 받은 사본은 삭제
+                        file_path.unlink()
+                        self.logger.info(f"중복 파일 제거: {file_path.name} -> {duplicate.name}")
+                        return self._mark_skipped(result, duplicate)
+                    self.downloaded_hashes[dedup_key] = str(file_path)
                 
                 # 다운로드 성공
                 result.update({
@@ -267,6 +505,10 @@ class FileDownloader:
                 self.stats['successful_downloads'] += 1
                 self.stats['total_size'] += downloaded_size
                 
+                if etag or last_modified:
+                    self._etag_cache[url] = (etag, last_modified, str(file_path))
+                    self._etag_cache_dirty = True
+                
                 self.logger.info(f"다운로드 완료: {filename} ({downloaded_size} bytes)")
                 break
                 
@@ -285,9 +527,377 @@ class FileDownloader:
         if not result['success']:
             self.stats['failed_downloads'] += 1
             self.logger.error(f"다운로드 최종 실패: {url} - {result['error']}")
+            
+            # 예약만 하고 내용을 받지 못한 빈 파일 정리
+            self._remove_if_empty(file_path)
         
         return result
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """재사용할 HTTP 세션을 반환 (없거나 다른 이벤트 루프에서 만든 경우 새로 생성)"""
+        if self._shared_session is not None and not self._shared_session.closed:
+            return self._shared_session
+        
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent * 2,
+                limit_per_host=self.max_concurrent,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+                read_bufsize=READ_BUFSIZE
+            )
+            self._session_loop = loop
+        return self._session
+    
+    def set_shared_session(self, session: Optional[aiohttp.ClientSession]):
+        """다른 컴포넌트와 공유할 aiohttp 세션 지정 (종료는 호출자가 담당)"""
+        self._shared_session = session
+    
+    async def aclose(self):
+        """재사용 중인 HTTP 세션 종료 (외부에서 받은 공유 세션은 닫지 않음)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    def _mark_skipped(self, result: Dict[str, Any], existing_path: Path) -> Dict[str, Any]:
+        """이미 있는 파일로 다운로드를 대신한 결과를 기록"""
+        result.update({
+            'success': True,
+            'skipped': True,
+            'filename': existing_path.name,
+            'file_path': str(existing_path),
+            'size': existing_path.stat().st_size
+        })
+        self.stats['skipped_downloads'] += 1
+        return result
+    
+    def _find_duplicate(self, key: Tuple[str, int, str]) -> Optional[Path]:
+        """같은 키로 이미 받은 파일이 아직 남아 있으면 그 경로를 반환"""
+        existing = self.downloaded_hashes.get(key)
+        if existing and os.path.exists(existing):
+            return Path(existing)
+        return None
+    
+    @staticmethod
+    def _remove_if_empty(file_path: Optional[Path]):
+        """예약만 하고 내용을 받지 못한 빈 파일 삭제"""
+        if file_path is None:
+            return
+        try:
+            if file_path.stat().st_size == 0:
+                file_path.unlink()
+        except OSError:
+            pass
+    
+    def _load_etag_cache(self):
+        """현재 다운로드 디렉터리의 ETag 캐시를 불러옴 (디렉터리가 바뀐 경우에만)"""
+        if self._etag_cache_dir == self.download_dir:
+            return
+        
+        self._etag_cache = {}
+        self._etag_cache_dir = self.download_dir
+        self._etag_cache_dirty = False
+        
+        cache_path = self.download_dir / ETAG_CACHE_FILE
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                self._etag_cache = {url: tuple(entry) for url, entry in json.load(f).items()}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"ETag 캐시 로드 실패 {cache_path}: {e}")
+    
+    def _save_etag_cache(self):
+        """ETag 캐시를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+        if not self._etag_cache_dirty or self._etag_cache_dir is None:
+            return
+        
+        cache_path = self._etag_cache_dir / ETAG_CACHE_FILE
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._etag_cache, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+            self._etag_cache_dirty = False
+        except Exception as e:
+            self.logger.warning(f"ETag 캐시 저장 실패 {cache_path}: {e}")
+    
+    def _conditional_headers(self, url: str) -> Tuple[Dict[str, str], Optional[Path]]:
+        """이전에 받은 파일이 남아 있으면 조건부 GET 헤더와 그 파일 경로를 반환"""
+        cached = self._etag_cache.get(url)
+        if not cached:
+            return {}, None
+        
+        etag, last_modified, file_path = cached
+        cached_path = Path(file_path)
+        if not cached_path.exists():
+            return {}, None
+        
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers, cached_path
+    
+    async def _stream_to_file(self,
+                              response: aiohttp.ClientResponse,
+                              file_path: Path,
+                              total_size: int,
+                              progress_callback: Callable = None,
+                              resume_from: int = 0,
+                              hasher=None) -> int:
+        """
+        응답 본문을 파일에 순서대로 기록하고 파일의 최종 크기를 반환
+        
+        resume_from이 0보다 크면 기존 파일의 해당 위치부터 이어서 기록합니다.
+        hasher가 주어지면 기록하는 청크로 해시를 함께 갱신합니다.
+        """
+        downloaded_size = resume_from
+        next_report = 0
+        last_report_time = 0.0
+        
+        file = open(file_path, 'r+b' if resume_from else 'wb')
+        fd = file.fileno()
+        offset = resume_from
+        preallocated = False
+        try:
+            # 크기를 알면 디스크 공간을 미리 연속으로 할당
+            if total_size > resume_from:
+                preallocated = await self._run_fd_io(self._preallocate, fd, total_size)
+            
+            # 받은 청크는 이어붙이지 않고 모아두었다가 한 번의 벡터 쓰기로 기록
+            chunks = []
+            buffered = 0
+            async for chunk in response.content.iter_chunked(self._chunk_size_for(total_size)):
+                chunks.append(chunk)
+                buffered += len(chunk)
+                downloaded_size += len(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                
+                if buffered >= WRITE_BUFFER_SIZE:
+                    data, chunks = chunks, []
+                    await self._run_fd_io(self._write_chunks, fd, data, offset)
+                    offset += buffered
+                    self.bytes_received += buffered
+                    buffered = 0
+                
+                if progress_callback:
+                    now = time.monotonic()
+                    if downloaded_size >= next_report or now - last_report_time > PROGRESS_REPORT_INTERVAL:
+                        progress_callback(downloaded_size, total_size)
+                        next_report = downloaded_size + PROGRESS_REPORT_BYTES
+                        last_report_time = now
+            
+            if chunks:
+                await self._run_fd_io(self._write_chunks, fd, chunks, offset)
+                offset += buffered
+                self.bytes_received += buffered
+        finally:
+            if preallocated:
+                # 중간에 끊긴 경우 실제로 기록한 위치까지 잘라서 이어받기 크기가 맞도록 함
+                await self._run_fd_io(file.truncate, offset)
+            await asyncio.to_thread(file.close)
+        
+        # 마지막 진행상황은 항상 전달
+        if progress_callback:
+            progress_callback(downloaded_size, total_size)
+        
+        return downloaded_size
+    
+    @staticmethod
+    def _retry_after_delay(response: aiohttp.ClientResponse, default: float) -> float:
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간으로 변환"""
+        value = response.headers.get('Retry-After', '').strip()
+        if not value:
+            return default
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return default
+        return min(max(delay, 0.0), MAX_RETRY_AFTER)
+    
+    @staticmethod
+    def _parse_content_range(value: str) -> Optional[Tuple[int, int, int]]:
+        """'bytes start-end/total' 형식의 Content-Range를 (start, end, total)로 변환 (total 미상이면 0)"""
+        try:
+            unit, _, spec = value.partition(' ')
+            byte_range, _, total = spec.partition('/')
+            start, _, end = byte_range.partition('-')
+            if unit.lower() != 'bytes':
+                return None
+            return int(start), int(end), 0 if total == '*' else int(total)
+        except ValueError:
+            return None
+    
+    def _can_split(self, response: aiohttp.ClientResponse, total_size: int) -> bool:
+        """Range 분할 다운로드 사용 가능 여부"""
+        return (self.parallel_segments > 1 and
+                hasattr(os, 'pwrite') and
+                response.status == 200 and
+                total_size > self.range_threshold and
+                response.headers.get('Accept-Ranges', '').lower() == 'bytes')
+    
+    async def _download_ranges(self,
+                               session: aiohttp.ClientSession,
+                               url: str,
+                               file_path: Path,
+                               total_size: int,
+                               progress_callback: Callable = None) -> int:
+        """
+        파일을 여러 바이트 구간으로 나누어 동시에 다운로드
+        
+        각 구간은 미리 크기를 잡아둔 파일의 해당 오프셋에 os.pwrite로 기록합니다.
+        서버가 Range 요청에 206으로 응답하지 않으면 일반 스트리밍으로 다시 받습니다.
+        """
+        segment_size = -(-total_size // self.parallel_segments)
+        ranges = [(start, min(start + segment_size, total_size) - 1)
+                  for start in range(0, total_size, segment_size)]
+        
+        downloaded = 0
+        
+        def on_written(size: int):
+            nonlocal downloaded
+            downloaded += size
+            self.bytes_received += size
+            if progress_callback:
+                progress_callback(downloaded, total_size)
+        
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            if not self._preallocate(fd, total_size):
+                os.ftruncate(fd, total_size)
+            tasks = [asyncio.create_task(self._download_segment(session, url, fd, start, end, on_written))
+                     for start, end in ranges]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # 한 구간이라도 실패하면 나머지 구간을 정리한 뒤 파일을 닫음
+                # (각 구간은 진행 중인 쓰기가 끝난 뒤에야 취소가 완료되므로 fd를 안전하게 닫을 수 있음)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        except _RangeNotSupported:
+            self.logger.info(f"Range 요청 미지원, 일반 다운로드로 전환: {url}")
+            os.close(fd)
+            fd = None
+            async with session.get(url, headers=IDENTITY_ENCODING,
+                                   timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                   allow_redirects=True, read_bufsize=READ_BUFSIZE) as response:
+                response.raise_for_status()
+                return await self._stream_to_file(response, file_path, total_size, progress_callback)
+        finally:
+            if fd is not None:
+                os.close(fd)
+        
+        return downloaded
+    
+    async def _download_segment(self,
+                                session: aiohttp.ClientSession,
+                                url: str,
+                                fd: int,
+                                start: int,
+                                end: int,
+                                on_written: Callable[[int], None]):
+        """바이트 구간 [start, end] 하나를 받아 파일의 같은 오프셋에 기록"""
+        headers = {'Range': f'bytes={start}-{end}', **IDENTITY_ENCODING}
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout),
+                               allow_redirects=True, read_bufsize=READ_BUFSIZE) as response:
+            if response.status != 206:
+                raise _RangeNotSupported(f"HTTP {response.status}")
+            
+            offset = start
+            chunks = []
+            buffered = 0
+            async for chunk in response.content.iter_chunked(LARGE_CHUNK_SIZE):
+                chunks.append(chunk)
+                buffered += len(chunk)
+                if buffered >= WRITE_BUFFER_SIZE:
+                    data, chunks = chunks, []
+                    await self._run_fd_io(self._write_chunks, fd, data, offset)
+                    offset += buffered
+                    on_written(buffered)
+                    buffered = 0
+            
+            if chunks:
+                await self._run_fd_io(self._write_chunks, fd, chunks, offset)
+                offset += buffered
+                on_written(buffered)
+        
+        if offset != end + 1:
+            raise aiohttp.ClientPayloadError(f"구간 다운로드 불완전: bytes={start}-{end}, 수신 {offset - start} bytes")
+    
+    @staticmethod
+    async def _run_fd_io(func: Callable, *args):
+        """
+        파일 디스크립터를 사용하는 블로킹 I/O를 스레드에서 실행
+        
+        작업이 취소되어도 스레드에서 이미 실행 중인 pwritev 등은 멈추지 않으므로,
+        끝날 때까지 기다린 뒤 취소를 전파합니다. 호출한 쪽이 fd를 닫은 뒤(같은 번호가 다른 파일에
+        재사용된 뒤) 늦게 끝난 쓰기가 엉뚱한 파일에 기록되지 않도록 하기 위함입니다.
+        """
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            while not future.done():
+                try:
+                    await asyncio.wait([future])
+                except asyncio.CancelledError:
+                    pass
+            raise
+    
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> bool:
+        """posix_fallocate로 파일 공간을 미리 할당 (지원하지 않는 플랫폼/파일시스템이면 False)"""
+        if size <= 0 or not hasattr(os, 'posix_fallocate'):
+            return False
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return True
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _write_chunks(fd: int, chunks: List[bytes], offset: int):
+        """
+        chunks 전체를 offset 위치부터 순서대로 기록
+        
+        os.pwritev가 있으면 청크를 복사하지 않고 시스템 호출 한 번(IOV_MAX개 단위)으로 제출하고,
+        없으면(Windows 등) 하나로 합친 뒤 해당 위치에 기록합니다.
+        """
+        if hasattr(os, 'pwritev'):
+            views = [memoryview(chunk) for chunk in chunks]
+            while views:
+                written = os.pwritev(fd, views[:IOV_MAX], offset)
+                offset += written
+                # 부분 기록된 경우 기록한 만큼 버퍼를 건너뛰고 이어서 기록
+                done = 0
+                while done < len(views) and written >= len(views[done]):
+                    written -= len(views[done])
+                    done += 1
+                del views[:done]
+                if written:
+                    views[0] = views[0][written:]
+            return
+        
+        view = memoryview(b''.join(chunks))
+        os.lseek(fd, offset, os.SEEK_SET)
+        while view:
+            view = view[os.write(fd, view):]
+    
     async def download_files(self, 
                            urls: List[str], 
                            output_dir: str = None,
@@ -301,45 +911,149 @@ class FileDownloader:
             progress_callback: 진행상황 콜백 함수
             
         Returns:
-            다운로드 결과 목록
+            다운로드 결과 목록 (urls와 같은 순서)
+        """
+        results = [None] * len(urls)
+        async for index, result in self._iter_indexed_downloads(urls, output_dir, progress_callback):
+            results[index] = result
+        return results
+    
+    async def iter_download_files(self, 
+                                  urls: Union[List[str], AsyncIterable[str]], 
+                                  output_dir: str = None,
+                                  progress_callback: Callable = None) -> AsyncIterator[Dict[str, Any]]:
         """
+        여러 파일을 비동기로 다운로드하면서 끝나는 순서대로 결과를 하나씩 반환
+        
+        결과 목록 전체를 모아두지 않으므로 URL이 매우 많을 때 사용합니다.
+        urls에 비동기 이터러블을 넘기면 링크 탐지와 동시에, 받는 대로 다운로드를 시작합니다.
+        
+        Args:
+            urls: 다운로드할 URL 목록 또는 URL을 차례로 내주는 비동기 이터러블
+            output_dir: 출력 디렉터리 (선택사항)
+            progress_callback: 진행상황 콜백 함수
+            
+        Yields:
+            다운로드 결과 딕셔너리
+        """
+        async for _, result in self._iter_indexed_downloads(urls, output_dir, progress_callback):
+            yield result
+    
+    async def _iter_indexed_downloads(self,
+                                      urls: Union[List[str], AsyncIterable[str]],
+                                      output_dir: str = None,
+                                      progress_callback: Callable = None) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """작업자 큐로 다운로드하고 (urls 내 위치, 결과)를 끝나는 순서대로 반환"""
         if output_dir:
             self.download_dir = Path(output_dir)
             self.download_dir.mkdir(parents=True, exist_ok=True)
         
-        self.stats['total_files'] = len(urls)
+        # 비동기 이터러블은 전체 개수를 미리 알 수 없으므로 받는 대로 센다
+        sized = hasattr(urls, '__len__')
+        self.stats['total_files'] = len(urls) if sized else 0
         self.stats['start_time'] = time.time()
+        self._load_etag_cache()
         
-        # 세마포어로 동시 다운로드 수 제한
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        session = await self._get_session()
         
-        async def download_with_semaphore(session, url):
-            async with semaphore:
-                return await self.download_file(session, url, progress_callback=progress_callback)
+        # URL 수와 관계없이 max_concurrency개의 작업자만 만들고, 크기가 제한된 큐로 URL과 결과를 전달
+        queue = asyncio.Queue(maxsize=self.max_concurrency * 4)
+        done = asyncio.Queue(maxsize=self.max_concurrency * 4)
+        progress_bar = (tqdm(total=len(urls) if sized else None, desc="파일 다운로드")
+                        if progress_callback is None else None)
+        worker_count = min(self.max_concurrency, len(urls)) if sized else self.max_concurrency
         
-        # HTTP 세션 설정
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent * 2)
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # 동시 다운로드 수를 조정할 수 있으면 작업자는 현재 concurrency만큼만 동시에 다운로드
+        gated = self.max_concurrency > self.max_concurrent
+        condition = self._slot_condition = asyncio.Condition()
+        active = 0
         
-        async with aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        ) as session:
-            
-            # 모든 파일 다운로드 시작
-            tasks = [download_with_semaphore(session, url) for url in urls]
-            
-            # 진행률 표시와 함께 실행
-            if progress_callback is None:
-                results = await tqdm.gather(*tasks, desc="파일 다운로드")
-            else:
-                results = await asyncio.gather(*tasks)
+        async def download(url):
+            nonlocal active
+            self.in_flight += 1
+            try:
+                if not gated:
+                    return await self.download_file(session, url, progress_callback=progress_callback)
+                
+                async with condition:
+                    await condition.wait_for(lambda: active < self.concurrency)
+                    active += 1
+                try:
+                    return await self.download_file(session, url, progress_callback=progress_callback)
+                finally:
+                    async with condition:
+                        active -= 1
+                        condition.notify()
+            finally:
+                self.in_flight -= 1
+        
+        async def worker():
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    index, url = item
+                    await done.put((index, await download(url)))
+            except Exception as e:
+                await done.put(e)
+                return
+            await done.put(None)
+        
+        async def producer():
+            try:
+                if sized:
+                    for item in enumerate(urls):
+                        await queue.put(item)
+                else:
+                    index = 0
+                    async for url in urls:
+                        self.stats['total_files'] += 1
+                        await queue.put((index, url))
+                        index += 1
+            except Exception as e:
+                # URL을 내주던 쪽의 예외는 결과를 기다리는 호출자에게 전달
+                await done.put(e)
+            for _ in range(worker_count):
+                await queue.put(None)
+        
+        tasks = [asyncio.create_task(producer())]
+        tasks += [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            finished = 0
+            while finished < worker_count:
+                item = await done.get()
+                if item is None:
+                    finished += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                if progress_bar is not None:
+                    progress_bar.update(1)
+                yield item
+        finally:
+            # 호출자가 중간에 멈추거나 예외가 나도 작업자가 남지 않도록 정리
+            for task in tasks:
+                task.cancel()
+            if progress_bar is not None:
+                progress_bar.close()
+            self._save_etag_cache()
         
         self.stats['end_time'] = time.time()
         self.print_stats()
+    
+    async def set_concurrency(self, value: int) -> int:
+        """
+        동시 다운로드 수를 1 ~ max_concurrency 범위로 조정 (실행 중인 download_files에도 바로 적용)
         
-        return results
+        Returns:
+            적용된 동시 다운로드 수
+        """
+        self.concurrency = max(1, min(value, self.max_concurrency))
+        if self._slot_condition is not None:
+            async with self._slot_condition:
+                self._slot_condition.notify_all()
+        return self.concurrency
     
     def download_files_sync(self, 
                           urls: List[str], 
@@ -359,23 +1073,40 @@ class FileDownloader:
             self.download_dir.mkdir(parents=True, exist_ok=True)
         
         results = []
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
         
         self.stats['total_files'] = len(urls)
         self.stats['start_time'] = time.time()
         
-        for url in tqdm(urls, desc="파일 다운로드"):
-            result = self._download_file_sync(session, url)
-            results.append(result)
+        session = self._shared_sync_session or self._create_sync_session()
+        try:
+            for url in tqdm(urls, desc="파일 다운로드"):
+                result = self._download_file_sync(session, url)
+                results.append(result)
+        finally:
+            # 공유 세션은 다른 컴포넌트가 계속 사용하므로 닫지 않음
+            if session is not self._shared_sync_session:
+                session.close()
         
         self.stats['end_time'] = time.time()
         self.print_stats()
         
         return results
     
+    def _create_sync_session(self) -> requests.Session:
+        """연결 풀 크기를 맞춘 동기 다운로드용 세션 생성 (재시도는 직접 처리)"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concurrent,
+            pool_maxsize=self.max_concurrent * 2,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        return session
+    
     def _download_file_sync(self, session: requests.Session, url: str) -> Dict[str, Any]:
         """
         동기 방식으로 단일 파일 다운로드
@@ -383,54 +1114,45 @@ class FileDownloader:
         result = {
             'url': url,
             'success': False,
+            'skipped': False,
             'filename': '',
             'file_path': '',
             'size': 0,
             'error': None
         }
+        file_path = None
         
         for attempt in range(self.retry_count + 1):
             try:
-                # HEAD 요청으로 파일 정보 확인
-                head_response = session.head(url, timeout=self.timeout)
-                
-                if head_response.status_code not in [200, 206]:
-                    result['error'] = f"HTTP {head_response.status_code}"
-                    continue
-                
-                # 파일명 결정
-                content_disposition = head_response.headers.get('Content-Disposition', '')
-                filename = self.get_filename_from_url(url, content_disposition)
-                
-                # 확장자가 없으면 Content-Type에서 추정
-                if not os.path.splitext(filename)[1]:
-                    content_type = head_response.headers.get('Content-Type', '')
-                    if content_type:
-                        ext = self.get_file_extension_from_content_type(content_type)
-                        if ext:
-                            filename += ext
-                
-                # 파일 경로 설정
-                file_path = self.download_dir / filename
-                
-                # 중복 파일명 처리
-                counter = 1
-                base_name, ext = os.path.splitext(filename)
-                while file_path.exists():
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    file_path = self.download_dir / new_filename
-                    counter += 1
-                
-                # 파일 다운로드
-                response = session.get(url, timeout=self.timeout, stream=True)
-                response.raise_for_status()
-                
-                downloaded_size = 0
-                with open(file_path, 'wb') as file:
-                    for chunk in response.iter_content(chunk_size=self.chunk_size):
-                        if chunk:
-                            file.write(chunk)
-                            downloaded_size += len(chunk)
+                # 파일 다운로드 (별도 HEAD 요청 없이 GET 응답 헤더에서 파일 정보 확인)
+                with session.get(url, timeout=self.timeout, stream=True) as response:
+                    if response.status_code not in [200, 206]:
+                        result['error'] = f"HTTP {response.status_code}"
+                        continue
+                    
+                    # 파일명 결정
+                    content_disposition = response.headers.get('Content-Disposition', '')
+                    filename = self.get_filename_from_url(url, content_disposition)
+                    
+                    # 확장자가 없으면 Content-Type에서 추정
+                    if not os.path.splitext(filename)[1]:
+                        content_type = response.headers.get('Content-Type', '')
+                        if content_type:
+                            ext = self.get_file_extension_from_content_type(content_type)
+                            if ext:
+                                filename += ext
+                    
+                    # 파일 경로 설정 (재시도에서는 이전 시도의 파일을 덮어씀)
+                    if file_path is None:
+                        file_path = self._reserve_path(filename)
+                    
+                    total_size = int(response.headers.get('Content-Length', 0))
+                    downloaded_size = 0
+                    with open(file_path, 'wb') as file:
+                        for chunk in response.iter_content(chunk_size=max(self._chunk_size_for(total_size), LARGE_CHUNK_SIZE)):
+                            if chunk:
+                                file.write(chunk)
+                                downloaded_size += len(chunk)
                 
                 # 성공
                 result.update({
@@ -455,6 +1177,7 @@ class FileDownloader:
         
         if not result['success']:
             self.stats['failed_downloads'] += 1
+            self._remove_if_empty(file_path)
         
         return result
     
@@ -467,6 +1190,8 @@ class FileDownloader:
             print(f"총 파일 수: {self.stats['total_files']}")
             print(f"성공: {self.stats['successful_downloads']}")
             print(f"실패: {self.stats['failed_downloads']}")
+            if self.stats['skipped_downloads']:
+                print(f"변경 없음(건너뜀): {self.stats['skipped_downloads']}")
             print(f"총 다운로드 크기: {self.format_size(self.stats['total_size'])}")
             print(f"소요 시간: {duration:.2f}초")
             if duration > 0:
@@ -1,11 +1,15 @@
 import ftplib
 import paramiko
 import os
+import posixpath
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 from pathlib import Path
 
+# 업로드 시 한 번에 읽고 쓰는 크기 (ftplib 기본값 8KiB, paramiko 기본값 32KiB)
+UPLOAD_BLOCK_SIZE = 1024 * 1024
+
 # FTPError 정의
 class FTPError(Exception):
     """FTP 관련 오류"""
@@ -22,13 +26,16 @@ def get_logger():
         logger.setLevel(logging.INFO)
     return logger
 
+_LOGGER = get_logger()
+
 class FTPClient:
     def __init__(self, config: Dict[str, Any]):
-        self.logger = get_logger()
+        self.logger = _LOGGER
         self.config = config
         self.connection: Optional[ftplib.FTP] = None
         self.sftp_connection: Optional[paramiko.SFTPClient] = None
         self.ssh_client: Optional[paramiko.SSHClient] = None
+        self._known_remote_dirs: Set[str] = set()
         
         self.host = config.get('host')
         self.port = config.get('port', 21)
@@ -49,7 +56,7 @@ class FTPClient:
             else:
                 return self._connect_ftp()
         except Exception as e:
-            self.logger.error(f"FTP connection failed: {e}")
+            self.logger.error("FTP connection failed: %s", e)
             raise FTPError(f"Connection failed: {e}")
     
     def _connect_ftp(self) -> bool:
@@ -59,11 +66,11 @@ class FTPClient:
             self.connection.connect(self.host, self.port, timeout=self.timeout)
             self.connection.login(self.username, self.password)
             
-            self.logger.info(f"FTP connected to {self.host}:{self.port}")
+            self.logger.info("FTP connected to %s:%s", self.host, self.port)
             return True
             
         except ftplib.all_errors as e:
-            self.logger.error(f"FTP connection error: {e}")
+            self.logger.error("FTP connection error: %s", e)
             raise FTPError(f"FTP connection failed: {e}")
     
     def _connect_sftp(self) -> bool:
@@ -79,14 +86,15 @@ class FTPClient:
             )
             
             self.sftp_connection = self.ssh_client.open_sftp()
-            self.logger.info(f"SFTP connected to {self.host}:{self.port}")
+            self.logger.info("SFTP connected to %s:%s", self.host, self.port)
             return True
             
         except Exception as e:
-            self.logger.error(f"SFTP connection error: {e}")
+            self.logger.error("SFTP connection error: %s", e)
             raise FTPError(f"SFTP connection failed: {e}")
     
     def disconnect(self) -> None:
+        self._known_remote_dirs.clear()
         try:
             if self.connection:
                 self.connection.quit()
@@ -103,7 +111,7 @@ class FTPClient:
                 self.logger.info("SFTP disconnected")
                 
         except Exception as e:
-            self.logger.warning(f"Error during disconnect: {e}")
+            self.logger.warning("Error during disconnect: %s", e)
     
     def upload_file(self, local_file_path: str, remote_file_name: str = None) -> bool:
         if not os.path.exists(local_file_path):
@@ -112,7 +120,7 @@ class FTPClient:
         if remote_file_name is None:
             remote_file_name = os.path.basename(local_file_path)
         
-        remote_path = os.path.join(self.remote_directory, remote_file_name).replace('\\', '/')
+        remote_path = posixpath.join(self.remote_directory, remote_file_name)
         
         for attempt in range(self.max_retries):
             try:
@@ -125,7 +133,7 @@ class FTPClient:
                     return self._upload_ftp(local_file_path, remote_path)
                     
             except Exception as e:
-                self.logger.warning(f"Upload attempt {attempt + 1} failed: {e}")
+                self.logger.warning("Upload attempt %d failed: %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
                     raise FTPError(f"Upload failed after {self.max_retries} attempts: {e}")
                 time.sleep(2 ** attempt)
@@ -134,12 +142,12 @@ class FTPClient:
     
     def _upload_ftp(self, local_file_path: str, remote_path: str) -> bool:
         try:
-            self._ensure_remote_directory(os.path.dirname(remote_path))
+            self._ensure_remote_directory(posixpath.dirname(remote_path))
             
             with open(local_file_path, 'rb') as file:
-                self.connection.storbinary(f'STOR {remote_path}', file)
+                self._store_file(f'STOR {remote_path}', file)
             
-            self.logger.info(f"File uploaded: {local_file_path} -> {remote_path}")
+            self.logger.debug("File uploaded: %s -> %s", local_file_path, remote_path)
             return True
             
         except ftplib.all_errors as e:
@@ -147,23 +155,46 @@ class FTPClient:
     
     def _upload_sftp(self, local_file_path: str, remote_path: str) -> bool:
         try:
-            remote_dir = os.path.dirname(remote_path)
+            remote_dir = posixpath.dirname(remote_path)
             self._ensure_remote_directory_sftp(remote_dir)
             
-            self.sftp_connection.put(local_file_path, remote_path)
-            self.logger.info(f"File uploaded via SFTP: {local_file_path} -> {remote_path}")
+            file_size = os.path.getsize(local_file_path)
+            with open(local_file_path, 'rb') as local_file:
+                with self.sftp_connection.open(remote_path, 'wb') as remote_file:
+                    remote_file.set_pipelined(True)
+                    while True:
+                        chunk = local_file.read(UPLOAD_BLOCK_SIZE)
+                        if not chunk:
+                            break
+                        remote_file.write(chunk)
+            
+            remote_size = self.sftp_connection.stat(remote_path).st_size
+            if remote_size != file_size:
+                raise FTPError(f"Size mismatch after upload: local {file_size}, remote {remote_size}")
+            
+            self.logger.debug("File uploaded via SFTP: %s -> %s", local_file_path, remote_path)
             return True
             
         except Exception as e:
             raise FTPError(f"SFTP upload failed: {e}")
     
+    def _store_file(self, cmd: str, file) -> str:
+        if isinstance(self.connection, ftplib.FTP_TLS):
+            return self.connection.storbinary(cmd, file, blocksize=UPLOAD_BLOCK_SIZE)
+        
+        self.connection.voidcmd('TYPE I')
+        with self.connection.transfercmd(cmd) as conn:
+            conn.sendfile(file)
+        return self.connection.voidresp()
+    
     def _ensure_remote_directory(self, remote_dir: str) -> None:
-        if not remote_dir or remote_dir == '/':
+        if not remote_dir or remote_dir == '/' or remote_dir in self._known_remote_dirs:
             return
         
         try:
             self.connection.cwd(remote_dir)
             self.connection.cwd('/')
+            self._known_remote_dirs.add(remote_dir)
         except ftplib.error_perm:
             dirs = remote_dir.strip('/').split('/')
             current_path = '/'
@@ -172,21 +203,26 @@ class FTPClient:
                 if not dir_name:
                     continue
                     
-                current_path = os.path.join(current_path, dir_name).replace('\\', '/')
+                current_path = posixpath.join(current_path, dir_name)
+                
+                if current_path in self._known_remote_dirs:
+                    continue
                 
                 try:
                     self.connection.cwd(current_path)
+                    self._known_remote_dirs.add(current_path)
                 except ftplib.error_perm:
                     try:
                         self.connection.mkd(current_path)
-                        self.logger.info(f"Created remote directory: {current_path}")
+                        self._known_remote_dirs.add(current_path)
+                        self.logger.debug("Created remote directory: %s", current_path)
                     except ftplib.error_perm:
                         pass
             
             self.connection.cwd('/')
     
     def _ensure_remote_directory_sftp(self, remote_dir: str) -> None:
-        if not remote_dir or remote_dir == '/':
+        if not remote_dir or remote_dir == '/' or remote_dir in self._known_remote_dirs:
             return
         
         dirs = remote_dir.strip('/').split('/')
@@ -196,16 +232,21 @@ class FTPClient:
             if not dir_name:
                 continue
                 
-            current_path = os.path.join(current_path, dir_name).replace('\\', '/')
+            current_path = posixpath.join(current_path, dir_name)
+            
+            if current_path in self._known_remote_dirs:
+                continue
             
             try:
                 self.sftp_connection.stat(current_path)
+                self._known_remote_dirs.add(current_path)
             except FileNotFoundError:
                 try:
                     self.sftp_connection.mkdir(current_path)
-                    self.logger.info(f"Created remote SFTP directory: {current_path}")
+                    self._known_remote_dirs.add(current_path)
+                    self.logger.debug("Created remote SFTP directory: %s", current_path)
                 except Exception as e:
-                    self.logger.warning(f"Could not create directory {current_path}: {e}")
+                    self.logger.warning("Could not create directory %s: %s", current_path, e)
     
     def is_connected(self) -> bool:
         try:
@@ -225,7 +266,7 @@ class FTPClient:
                 self.connection.nlst()
             return True
         except Exception as e:
-            self.logger.error(f"Connection test failed: {e}")
+            self.logger.error("Connection test failed: %s", e)
             return False
         finally:
             self.disconnect()
\ No newline at end of file
@@ -3,11 +3,143 @@
 웹페이지에서 다운로드 가능한 파일 링크를 탐지하고 추출합니다.
 """
 
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-from typing import List, Set, Dict, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
+from typing import List, Set, Dict, Optional, Iterable, Tuple, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from collections import deque, defaultdict
+from itertools import chain
 import logging
+import re
+
+# pyahocorasick이 있으면 확장자 매칭에 Aho-Corasick 오토마톤 사용
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# httpx가 있으면 http2 설정 시 페이지/HEAD 요청에 HTTP/2 클라이언트 사용
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# lxml(C 구현)이 있으면 사용하고 없으면 내장 html.parser 사용
+try:
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    HTML_PARSER = 'html.parser'
+
+# 비동기 페이지 요청 실패로 처리할 예외
+_PAGE_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+if httpx is not None:
+    _PAGE_REQUEST_ERRORS += (httpx.HTTPError,)
+
+# 문서 앞부분의 <meta charset=...> / http-equiv 선언에서 인코딩을 찾는 패턴
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?([\w\-]+)', re.I)
+
+
+def _sniff_encoding(content: bytes) -> str:
+    """
+    본문 앞 1024바이트의 charset 선언으로 인코딩을 결정 (없으면 UTF-8)
+    
+    chardet 같은 전체 본문 통계 분석을 하지 않기 위한 가벼운 휴리스틱이며,
+    잘못 추정한 경우에는 파서의 인코딩 대체 처리에 맡깁니다.
+    """
+    m = _CHARSET_RE.search(content[:1024])
+    return m.group(1).decode('ascii', 'ignore') if m else 'utf-8'
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """같은 URL을 여러 번 파싱하지 않도록 urlparse 결과를 캐시"""
+    return urlparse(url)
+
+
+def _normalize_url(url: str) -> str:
+    """
+    같은 리소스를 가리키는 URL이 하나의 키가 되도록 정규화
+    
+    스킴/호스트 소문자화, fragment 제거, 쿼리 파라미터 정렬을 수행합니다.
+    (비교용 키로만 사용하며 실제 요청에는 원래 URL을 사용)
+    """
+    parsed = _cached_urlparse(url)
+    query = parsed.query
+    if '&' in query:
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(),
+                           query=query, fragment='').geturl()
+
+
+def _resolve_link(href: str, base_url: str, base_parsed) -> str:
+    """
+    href를 절대 URL로 변환 (흔한 형태는 urljoin 없이 바로 조합)
+    
+    Args:
+        href: 태그의 href/src 값
+        base_url: 기준 URL
+        base_parsed: base_url의 파싱 결과
+        
+    Returns:
+        절대 URL
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('//'):
+        return f"{base_parsed.scheme}:{href}"
+    if href.startswith('/') and '/.' not in href:
+        return f"{base_parsed.scheme}://{base_parsed.netloc}{href}"
+    return urljoin(base_url, href)
+
+
+@dataclass
+class LinkBatch:
+    """
+    한 페이지에서 추출한 링크를 열(column)별 리스트로 저장
+    
+    URL은 추가할 때 한 번만 파싱하고, 이후 필터링/도메인 비교는
+    같은 인덱스의 paths(소문자 경로) / netlocs(호스트) 값을 그대로 사용합니다.
+    """
+    urls: List[str] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    netlocs: List[str] = field(default_factory=list)
+    _seen: Set[str] = field(default_factory=set, repr=False)
+    
+    @classmethod
+    def from_urls(cls, urls: Iterable[str]) -> 'LinkBatch':
+        """URL 목록으로 LinkBatch 생성"""
+        batch = cls()
+        for url in urls:
+            batch.add(url)
+        return batch
+    
+    def add(self, url: str):
+        """중복되지 않은 URL을 한 번 파싱하여 각 열에 추가"""
+        if url in self._seen:
+            return
+        self._seen.add(url)
+        # urlparse는 경로에서 ';params'를 분리하므로 '/a.pdf;jsessionid=X'도 확장자로 판별됨
+        # (is_file_link_by_extension과 같은 경로 기준)
+        parsed = _cached_urlparse(url)
+        self.urls.append(url)
+        self.paths.append(parsed.path.lower())
+        self.netlocs.append(parsed.netloc)
+    
+    def __len__(self) -> int:
+        return len(self.urls)
+    
+    def __iter__(self):
+        return iter(self.urls)
+    
+    def __contains__(self, url) -> bool:
+        return url in self._seen
 
 
 class LinkDetector:
@@ -26,21 +158,79 @@ class LinkDetector:
         'others': ['.iso', '.torrent', '.apk', '.asc', '.sig', '.gpg']
     }
     
-    def __init__(self, session: Optional[requests.Session] = None, use_tor: bool = False):
+    # 다운로드 엔드포인트 URL 패턴
+    DOWNLOAD_PATTERNS = (
+        '/downloads/',
+        '/download/',
+        '/files/',
+        '/attachment',
+        '/get_file',
+        '/file/',
+        'download=',
+        'attachment=',
+        'file_id=',
+        'fileid=',
+        'get=',
+        'export=',
+        'action=download'
+    )
+    _DOWNLOAD_PATTERN_RE = re.compile('|'.join(map(re.escape, DOWNLOAD_PATTERNS)))
+    
+    # Content-Disposition 헤더의 첨부 파일 표시
+    _CD_ATTACHMENT_RE = re.compile(r'attachment', re.I)
+    
+    # 링크를 담는 태그와 속성
+    LINK_ATTRS = {'a': 'href', 'link': 'href', 'img': 'src', 'script': 'src'}
+    LINK_TAGS = list(LINK_ATTRS)
+    
+    # 이 크기(바이트)를 넘거나 크기를 알 수 없는 페이지는 스트리밍 파싱
+    LARGE_PAGE_THRESHOLD = 2 * 1024 * 1024
+    
+    # 링크 추출에 필요한 태그만 파싱하기 위한 필터
+    LINK_STRAINER = SoupStrainer(LINK_TAGS)
+    
+    # 확장자로 판별되지 않는 링크에 동시에 보낼 HEAD 요청 수
+    HEAD_PROBE_WORKERS = 10
+    
+    # HEAD 요청 결과 캐시의 최대 항목 수
+    HEAD_CACHE_SIZE = 10000
+    
+    # find_file_links에서 동시에 가져올 최대 페이지 수 (전체 호스트 합계)
+    PAGE_FETCH_WORKERS = 10
+    
+    # HTTP/2 클라이언트의 최대 연결 수 (HEAD 요청 동시 실행 수도 같은 값으로 제한)
+    HTTP2_MAX_CONNECTIONS = 100
+    
+    def __init__(self, session: Optional[requests.Session] = None, use_tor: bool = False,
+                 aiohttp_session: Optional[aiohttp.ClientSession] = None,
+                 http2: bool = False):
         """
         LinkDetector 초기화
         
         Args:
             session: requests.Session 객체 (선택사항)
             use_tor: Tor 네트워크 사용 여부
+            aiohttp_session: 비동기 페이지 요청에 사용할 공유 aiohttp 세션 (선택사항)
+            http2: .onion이 아닌 비동기 페이지/HEAD 요청에 httpx HTTP/2 클라이언트 사용 여부
         """
         self.use_tor = use_tor
         self.logger = logging.getLogger(__name__)
         
         # 세션 초기화
         self.session = session or requests.Session()
+        self.aiohttp_session = aiohttp_session
         self.tor_downloader = None
         
+        # HTTP/2 클라이언트 (이벤트 루프 안에서 처음 사용할 때 생성)
+        self.http2 = http2
+        self.http_client = None
+        if self.http2 and httpx is None:
+            self.logger.warning("http2 설정이 있지만 httpx가 설치되지 않아 기존 세션 사용")
+            self.http2 = False
+        
+        # HEAD 요청으로 확인한 파일 링크 여부 캐시 (URL -> bool)
+        self._head_cache: Dict[str, bool] = {}
+        
         # Tor 사용 시 TorFileDownloader 준비 (lazy initialization)
         if self.use_tor:
             self.logger.info("Tor 모드로 LinkDetector 초기화 (필요시 Tor 세션 생성)")
@@ -53,13 +243,56 @@ class LinkDetector:
         self.all_extensions = set()
         for ext_list in self.FILE_EXTENSIONS.values():
             self.all_extensions.update(ext_list)
+        
+        # str.endswith에 바로 넘길 소문자 확장자 튜플 (긴 것부터) 및 확장자 -> 파일 타입 매핑
+        self._ext_tuple = tuple(sorted({ext.lower() for ext in self.all_extensions}, key=len, reverse=True))
+        self._ext_to_type = {ext.lower(): file_type
+                             for file_type, ext_list in self.FILE_EXTENSIONS.items()
+                             for ext in ext_list}
+        self._custom_ext_tuples: Dict[frozenset, tuple] = {}
+        
+        # 경로 끝 / Content-Disposition 파일명 끝의 확장자를 한 번에 찾는 정규식
+        # (긴 확장자부터 나열하므로 '.docx'가 '.doc'보다 먼저 일치)
+        self._ext_re = re.compile(
+            r'\.(?:' + '|'.join(re.escape(ext[1:]) for ext in self._ext_tuple) + r')(?=["\']?(?:;|\s|$))',
+            re.I
+        )
+        self._ext_automaton = self._build_ext_automaton(self._ext_tuple)
+    
+    def _get_http_client(self):
+        """HTTP/2 클라이언트를 처음 사용할 때 생성하여 반환 (http2 미사용 또는 h2 미설치 시 None)"""
+        if not self.http2:
+            return None
+        if self.http_client is None:
+            try:
+                self.http_client = httpx.AsyncClient(
+                    http2=True,
+                    headers=dict(self.session.headers),
+                    timeout=30,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=self.HTTP2_MAX_CONNECTIONS,
+                                        max_keepalive_connections=20)
+                )
+            except ImportError as e:
+                # httpx[http2] (h2 패키지) 미설치
+                self.logger.warning(f"HTTP/2 사용 불가 ({e}), 기존 세션 사용")
+                self.http2 = False
+                return None
+        return self.http_client
     
-    def get_page_content(self, url: str) -> Optional[BeautifulSoup]:
+    async def aclose(self):
+        """직접 생성한 HTTP/2 클라이언트 정리 (공유 aiohttp 세션은 생성한 쪽에서 닫음)"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+    
+    def get_page_content(self, url: str, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """
         웹페이지 내용을 가져와서 BeautifulSoup 객체로 반환
         
         Args:
             url: 대상 웹페이지 URL
+            strainer: 지정한 태그만 파싱할 SoupStrainer (선택사항)
             
         Returns:
             BeautifulSoup 객체 또는 None (실패시)
@@ -88,11 +321,12 @@ class LinkDetector:
             response = session_to_use.get(url, timeout=30)
             response.raise_for_status()
             
-            # 인코딩 감지 및 설정
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding
+            # 인코딩은 charset 선언만 확인 (apparent_encoding은 본문 전체를 분석하므로 사용하지 않음)
+            content = response.content
+            response.encoding = _sniff_encoding(content)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(content, HTML_PARSER, parse_only=strainer,
+                                 from_encoding=response.encoding)
             return soup
             
         except requests.RequestException as e:
@@ -102,7 +336,126 @@ class LinkDetector:
             self.logger.error(f"페이지 파싱 실패 {url}: {e}")
             return None
     
-    def extract_links_from_tags(self, soup: BeautifulSoup, base_url: str) -> Set[str]:
+    async def get_page_content_async(self, url: str, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        HTTP/2 클라이언트 또는 공유 aiohttp 세션으로 웹페이지를 가져와서 BeautifulSoup 객체로 반환
+        
+        .onion 주소이거나 사용할 비동기 클라이언트가 없으면 get_page_content를 별도 스레드에서 실행합니다.
+        
+        Args:
+            url: 대상 웹페이지 URL
+            strainer: 지정한 태그만 파싱할 SoupStrainer (선택사항)
+            
+        Returns:
+            BeautifulSoup 객체 또는 None (실패시)
+        """
+        if self.is_onion_url(url):
+            return await asyncio.to_thread(self.get_page_content, url, strainer)
+        
+        client = self._get_http_client()
+        if client is None and (self.aiohttp_session is None or self.aiohttp_session.closed):
+            return await asyncio.to_thread(self.get_page_content, url, strainer)
+        
+        try:
+            if client is not None:
+                response = await client.get(url)
+                response.raise_for_status()
+                content = response.content
+            else:
+                async with self.aiohttp_session.get(url, headers=self.session.headers,
+                                                    timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+            
+            return BeautifulSoup(content, HTML_PARSER, parse_only=strainer,
+                                 from_encoding=_sniff_encoding(content))
+            
+        except _PAGE_REQUEST_ERRORS as e:
+            self.logger.error(f"페이지 요청 실패 {url}: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"페이지 파싱 실패 {url}: {e}")
+            return None
+    
+    async def get_page_links_async(self, url: str) -> Optional[LinkBatch]:
+        """
+        웹페이지를 가져와서 링크 목록(LinkBatch)을 반환
+        
+        크기가 LARGE_PAGE_THRESHOLD를 넘거나 알 수 없는 페이지는 전체 DOM을 만들지 않고
+        lxml 풀 파서로 받는 대로 파싱합니다.
+        
+        Args:
+            url: 대상 웹페이지 URL
+            
+        Returns:
+            추출된 링크들의 LinkBatch 또는 None (실패시)
+        """
+        client = None if self.is_onion_url(url) else self._get_http_client()
+        if (etree is None or self.is_onion_url(url) or
+                (client is None and (self.aiohttp_session is None or self.aiohttp_session.closed))):
+            soup = await self.get_page_content_async(url, self.LINK_STRAINER)
+            return self.extract_links_from_tags(soup, url) if soup else None
+        
+        try:
+            if client is not None:
+                async with client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    
+                    if 0 < int(response.headers.get('Content-Length') or 0) <= self.LARGE_PAGE_THRESHOLD:
+                        return self._parse_links(await response.aread(), url)
+                    
+                    return await self._stream_links(response.aiter_bytes(65536), url)
+            
+            async with self.aiohttp_session.get(url, headers=self.session.headers,
+                                                timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                
+                if 0 < (response.content_length or 0) <= self.LARGE_PAGE_THRESHOLD:
+                    return self._parse_links(await response.read(), url)
+                
+                return await self._stream_links(response.content.iter_chunked(65536), url)
+            
+        except _PAGE_REQUEST_ERRORS as e:
+            self.logger.error(f"페이지 요청 실패 {url}: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"페이지 파싱 실패 {url}: {e}")
+            return None
+    
+    def _parse_links(self, content: bytes, base_url: str) -> LinkBatch:
+        """전체 본문을 받은 작은 페이지에서 링크 태그만 파싱하여 링크 추출"""
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=self.LINK_STRAINER,
+                             from_encoding=_sniff_encoding(content))
+        return self.extract_links_from_tags(soup, base_url)
+    
+    async def _stream_links(self, chunks: AsyncIterator[bytes], base_url: str) -> LinkBatch:
+        """응답 본문을 청크 단위로 lxml 풀 파서에 넣으면서 링크 태그만 처리하고 바로 해제"""
+        links = LinkBatch()
+        base_parsed = _cached_urlparse(base_url)
+        parser = etree.HTMLPullParser(events=('end',), tag=self.LINK_TAGS)
+        
+        def collect():
+            for _, elem in parser.read_events():
+                value = elem.get(self.LINK_ATTRS.get(elem.tag, ''))
+                if value:
+                    value = value.strip()
+                    if value:
+                        links.add(_resolve_link(value, base_url, base_parsed))
+                # 처리한 요소와 앞선 형제 요소를 해제하여 메모리를 요소 하나 수준으로 유지
+                elem.clear()
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+        
+        async for chunk in chunks:
+            parser.feed(chunk)
+            collect()
+        parser.close()
+        collect()
+        
+        return links
+    
+    def extract_links_from_tags(self, soup: BeautifulSoup, base_url: str) -> LinkBatch:
         """
         HTML 태그에서 링크를 추출
         
@@ -111,37 +464,19 @@ class LinkDetector:
             base_url: 기준 URL
             
         Returns:
-            추출된 링크들의 집합
+            추출된 링크들의 LinkBatch (중복 제거됨)
         """
-        links = set()
-        
-        # a 태그에서 href 속성 추출
-        for tag in soup.find_all('a', href=True):
-            href = tag['href'].strip()
-            if href:
-                absolute_url = urljoin(base_url, href)
-                links.add(absolute_url)
-        
-        # img 태그에서 src 속성 추출
-        for tag in soup.find_all('img', src=True):
-            src = tag['src'].strip()
-            if src:
-                absolute_url = urljoin(base_url, src)
-                links.add(absolute_url)
-        
-        # link 태그에서 href 속성 추출
-        for tag in soup.find_all('link', href=True):
-            href = tag['href'].strip()
-            if href:
-                absolute_url = urljoin(base_url, href)
-                links.add(absolute_url)
-        
-        # script 태그에서 src 속성 추출
-        for tag in soup.find_all('script', src=True):
-            src = tag['src'].strip()
-            if src:
-                absolute_url = urljoin(base_url, src)
-                links.add(absolute_url)
+        links = LinkBatch()
+        base_parsed = _cached_urlparse(base_url)
+        
+        # a/link 태그의 href, img/script 태그의 src 속성을 한 번의 순회로 추출
+        for tag in soup.find_all(self.LINK_TAGS):
+            value = tag.get(self.LINK_ATTRS[tag.name])
+            if not value:
+                continue
+            value = value.strip()
+            if value:
+                links.add(_resolve_link(value, base_url, base_parsed))
         
         return links
     
@@ -156,77 +491,268 @@ class LinkDetector:
         Returns:
             파일 링크 여부
         """
-        extensions = custom_extensions or self.all_extensions
+        if self.is_file_link_by_extension(url, custom_extensions):
+            return True
+        return self.classify_by_headers([url])[url]
+    
+    def is_file_link_by_extension(self, url: str, custom_extensions: Optional[Set[str]] = None) -> bool:
+        """
+        네트워크 요청 없이 URL 문자열(확장자, 다운로드 엔드포인트 패턴)만으로 파일 링크인지 확인
         
+        Args:
+            url: 확인할 URL
+            custom_extensions: 사용자 정의 확장자 집합
+            
+        Returns:
+            파일 링크 여부
+        """
         # URL 파싱
-        parsed = urlparse(url)
-        path = parsed.path.lower()
+        path = _cached_urlparse(url).path
         
         # 파일 확장자 확인
-        for ext in extensions:
-            if path.endswith(ext.lower()):
+        if custom_extensions:
+            if path.lower().endswith(self._ext_tuple_for(custom_extensions)):
                 return True
+        elif self._ext_re.search(path):
+            return True
         
         # 다운로드 엔드포인트 패턴 확인
-        download_patterns = [
-            '/downloads/',
-            '/download/',
-            '/files/',
-            '/attachment',
-            '/get_file',
-            '/file/',
-            'download=',
-            'attachment=',
-            'file_id=',
-            'fileid=',
-            'get=',
-            'export=',
-            'action=download'
-        ]
+        return self._is_download_endpoint(url)
+    
+    @staticmethod
+    def _build_ext_automaton(extensions: tuple):
+        """확장자 전체를 하나의 Aho-Corasick 오토마톤으로 컴파일 (pyahocorasick이 없으면 None)"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for ext in extensions:
+            automaton.add_word(ext, ext)
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_extension(self, path: str) -> Optional[str]:
+        """소문자 경로 끝에 붙은 알려진 확장자 중 가장 긴 것을 반환 (없으면 None)"""
+        if self._ext_automaton is not None:
+            # 경로 끝에서 끝나는 일치만 사용 (경로 중간의 '.pdf/' 같은 부분은 무시)
+            last = len(path) - 1
+            matched = None
+            for end_idx, ext in self._ext_automaton.iter(path):
+                if end_idx == last and (matched is None or len(ext) > len(matched)):
+                    matched = ext
+            return matched
         
-        for pattern in download_patterns:
-            if pattern in path or pattern in url.lower():
-                return True
+        match = self._ext_re.search(path)
+        return match.group(0).lower() if match else None
+    
+    def _ext_tuple_for(self, extensions) -> tuple:
+        """확장자 집합을 소문자 튜플로 변환 (사용자 정의 확장자는 집합별로 캐시)"""
+        if extensions is self._ext_tuple:
+            return extensions
+        key = frozenset(extensions)
+        ext_tuple = self._custom_ext_tuples.get(key)
+        if ext_tuple is None:
+            ext_tuple = self._custom_ext_tuples[key] = tuple(ext.lower() for ext in key)
+        return ext_tuple
+    
+    def _is_download_endpoint(self, url: str) -> bool:
+        """URL(경로/쿼리)에 다운로드 엔드포인트 패턴이 있는지 확인"""
+        return self._DOWNLOAD_PATTERN_RE.search(url.lower()) is not None
+    
+    def classify_by_headers(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """
+        HEAD 요청의 응답 헤더로 파일 링크 여부를 확인 (여러 URL을 동시에 요청)
+        
+        한 번 확인한 URL은 결과를 캐시하여 다시 요청하지 않습니다.
+        
+        Args:
+            urls: 확인할 URL들
+            
+        Returns:
+            URL별 파일 링크 여부
+        """
+        keys, results, pending = self._lookup_head_cache(urls)
+        
+        if len(pending) == 1:
+            (key, url), = pending.items()
+            results[key] = self.probe_content_type(url)
+        elif pending:
+            # requests 기본 연결 풀 크기(10)를 넘지 않도록 작업자 수 제한
+            with ThreadPoolExecutor(max_workers=min(self.HEAD_PROBE_WORKERS, len(pending))) as executor:
+                for key, is_file in zip(pending, executor.map(self.probe_content_type, pending.values())):
+                    results[key] = is_file
+        
+        return self._store_head_cache(keys, results, pending)
+    
+    async def classify_by_headers_async(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """
+        classify_by_headers의 비동기 버전
+        
+        HTTP/2 클라이언트가 있으면 HEAD 요청을 하나의 연결에 다중화하여 보내고,
+        없으면 classify_by_headers를 별도 스레드에서 실행합니다.
+        
+        Args:
+            urls: 확인할 URL들
+            
+        Returns:
+            URL별 파일 링크 여부
+        """
+        client = self._get_http_client()
+        if client is None:
+            return await asyncio.to_thread(self.classify_by_headers, list(urls))
+        
+        keys, results, pending = self._lookup_head_cache(urls)
+        if pending:
+            semaphore = asyncio.Semaphore(self.HTTP2_MAX_CONNECTIONS)
+            
+            async def probe(url):
+                async with semaphore:
+                    return await self.probe_content_type_async(url)
+            
+            for key, is_file in zip(pending, await asyncio.gather(*map(probe, pending.values()))):
+                results[key] = is_file
+        
+        return self._store_head_cache(keys, results, pending)
+    
+    def _lookup_head_cache(self, urls: Iterable[str]) -> Tuple[Dict[str, str], Dict[str, bool], Dict[str, str]]:
+        """URL별 정규화 키, 캐시에 있는 결과, 새로 요청할 키 -> URL을 반환"""
+        keys = {url: _normalize_url(url) for url in urls}
+        results = {key: self._head_cache[key] for key in keys.values() if key in self._head_cache}
         
+        # 정규화한 키가 같은 URL은 한 번만 요청
+        pending = {}
+        for url, key in keys.items():
+            if key not in results:
+                pending.setdefault(key, url)
+        
+        return keys, results, pending
+    
+    def _store_head_cache(self, keys: Dict[str, str], results: Dict[str, bool],
+                          pending: Dict[str, str]) -> Dict[str, bool]:
+        """새로 확인한 결과를 캐시에 저장하고 URL별 결과를 반환"""
+        for key in pending:
+            self._head_cache[key] = results[key]
+        # 캐시가 너무 커지면 오래된 항목부터 제거
+        while len(self._head_cache) > self.HEAD_CACHE_SIZE:
+            del self._head_cache[next(iter(self._head_cache))]
+        
+        return {url: results[key] for url, key in keys.items()}
+    
+    def probe_content_type(self, url: str) -> bool:
+        """HEAD 요청 한 번으로 Content-Disposition / Content-Type 헤더를 확인하여 파일 여부 반환"""
         # Content-Disposition 헤더 확인 (HEAD 요청으로)
         try:
             response = self.session.head(url, timeout=10, allow_redirects=True)
-            content_disposition = response.headers.get('Content-Disposition', '')
-            if 'attachment' in content_disposition.lower():
-                return True
-            
-            # Content-Type 헤더 확인
-            content_type = response.headers.get('Content-Type', '').lower()
-            file_content_types = [
-                'application/pdf', 'application/zip', 'application/octet-stream',
-                'image/', 'video/', 'audio/', 'application/msword',
-                'application/vnd.ms-excel', 'application/vnd.openxmlformats',
-                'application/download', 'application/force-download',
-                'application/x-download', 'binary/octet-stream'
-            ]
-            
-            for file_type in file_content_types:
-                if file_type in content_type:
-                    return True
-                    
+            return self._is_file_response(response.headers)
         except:
-            pass
+            return False
+    
+    async def probe_content_type_async(self, url: str) -> bool:
+        """probe_content_type의 비동기 버전 (HTTP/2 클라이언트 사용)"""
+        try:
+            response = await self._get_http_client().head(url, timeout=10)
+            return self._is_file_response(response.headers)
+        except Exception:
+            return False
+    
+    def _is_file_response(self, headers) -> bool:
+        """응답 헤더(Content-Disposition / Content-Type)로 파일 여부 판단"""
+        # 첨부 파일이거나 파일명이 알려진 확장자로 끝나면 파일로 판단
+        content_disposition = headers.get('Content-Disposition', '')
+        if content_disposition and (self._CD_ATTACHMENT_RE.search(content_disposition) or
+                                    self._ext_re.search(content_disposition)):
+            return True
+        
+        # Content-Type 헤더 확인
+        content_type = headers.get('Content-Type', '').lower()
+        file_content_types = [
+            'application/pdf', 'application/zip', 'application/octet-stream',
+            'image/', 'video/', 'audio/', 'application/msword',
+            'application/vnd.ms-excel', 'application/vnd.openxmlformats',
+            'application/download', 'application/force-download',
+            'application/x-download', 'binary/octet-stream'
+        ]
+        
+        for file_type in file_content_types:
+            if file_type in content_type:
+                return True
         
         return False
     
-    def filter_file_links(self, links: Set[str], 
+    def active_extensions(self, file_types: Optional[List[str]] = None,
+                          custom_extensions: Optional[Set[str]] = None) -> Optional[frozenset]:
+        """
+        찾으려는 파일 타입과 사용자 정의 확장자를 하나의 소문자 확장자 집합으로 합침
+        
+        여러 페이지/URL에 같은 조건으로 필터링할 때 한 번만 만들어 filter_file_links에 넘깁니다.
+        확장자 집합으로 미리 거를 수 없는 경우('.tar.gz'처럼 점이 여러 개이거나 점으로 시작하지 않는
+        사용자 정의 확장자)에는 None을 반환합니다.
+        
+        Args:
+            file_types: 원하는 파일 타입 목록 (None이면 전체)
+            custom_extensions: 사용자 정의 확장자 집합
+            
+        Returns:
+            확장자 집합 또는 None
+        """
+        if file_types is None:
+            file_types = self.FILE_EXTENSIONS.keys()
+        extensions = frozenset(ext.lower() for ext in chain(
+            chain.from_iterable(self.FILE_EXTENSIONS.get(file_type, ()) for file_type in file_types),
+            custom_extensions or ()
+        ))
+        if any(not ext.startswith('.') or ext.count('.') > 1 for ext in extensions):
+            return None
+        return extensions
+    
+    def filter_file_links(self, links: Iterable[str], 
                          file_types: Optional[List[str]] = None,
-                         custom_extensions: Optional[Set[str]] = None) -> Dict[str, List[str]]:
+                         custom_extensions: Optional[Set[str]] = None,
+                         active_exts: Optional[frozenset] = None) -> Dict[str, Set[str]]:
         """
         링크들을 파일 타입별로 필터링
         
         Args:
-            links: 필터링할 링크들
+            links: 필터링할 링크들 (LinkBatch 또는 URL 집합)
             file_types: 원하는 파일 타입 목록 (예: ['documents', 'images'])
             custom_extensions: 사용자 정의 확장자 집합
+            active_exts: active_extensions로 미리 만든 확장자 집합 (없으면 이 호출에서 생성)
             
         Returns:
-            파일 타입별로 분류된 링크 딕셔너리
+            파일 타입별로 분류된 링크 집합 딕셔너리
+        """
+        filtered_links, needs_probe = self._classify_links(links, file_types, custom_extensions, active_exts)
+        
+        # 2단계: 확장자만으로 결정되지 않은 링크만 모아서 HEAD 요청을 한꺼번에 보냄
+        # (어느 타입에도 속하지 않는 링크는 HEAD 결과와 관계없이 제외되므로 요청하지 않음)
+        for link, is_file in self.classify_by_headers(needs_probe).items():
+            if is_file:
+                filtered_links[needs_probe[link]].add(link)
+        
+        return filtered_links
+    
+    async def filter_file_links_async(self, links: Iterable[str],
+                                      file_types: Optional[List[str]] = None,
+                                      custom_extensions: Optional[Set[str]] = None,
+                                      active_exts: Optional[frozenset] = None) -> Dict[str, Set[str]]:
+        """filter_file_links의 비동기 버전 (HEAD 요청은 classify_by_headers_async로 보냄)"""
+        filtered_links, needs_probe = self._classify_links(links, file_types, custom_extensions, active_exts)
+        
+        if needs_probe:
+            for link, is_file in (await self.classify_by_headers_async(needs_probe)).items():
+                if is_file:
+                    filtered_links[needs_probe[link]].add(link)
+        
+        return filtered_links
+    
+    def _classify_links(self, links: Iterable[str],
+                        file_types: Optional[List[str]],
+                        custom_extensions: Optional[Set[str]],
+                        active_exts: Optional[frozenset] = None) -> Tuple[Dict[str, Set[str]], Dict[str, str]]:
+        """
+        네트워크 요청 없이 URL 문자열만으로 링크를 파일 타입별로 분류
+        
+        Returns:
+            (파일 타입별 링크 집합, HEAD 응답으로 확인해야 할 링크 -> 파일 타입)
         """
         filtered_links = {}
         
@@ -236,112 +762,139 @@ class LinkDetector:
         
         # 각 파일 타입별로 초기화
         for file_type in file_types:
-            filtered_links[file_type] = []
+            filtered_links[file_type] = set()
         
         # 사용자 정의 확장자가 있으면 추가
         if custom_extensions:
-            filtered_links['custom'] = []
+            filtered_links['custom'] = set()
+            custom_tuple = self._ext_tuple_for(custom_extensions)
         
-        for link in links:
-            if not self.is_file_link(link, custom_extensions):
-                continue
-                
-            parsed = urlparse(link)
-            path = parsed.path.lower()
-            
-            # 다운로드 엔드포인트인지 확인
-            is_download_endpoint = False
-            download_patterns = [
-                '/downloads/', '/download/', '/files/', '/attachment', '/get_file', '/file/',
-                'download=', 'attachment=', 'file_id=', 'fileid=', 'get=', 'export=', 'action=download'
-            ]
-            for pattern in download_patterns:
-                if pattern in path or pattern in link.lower():
-                    is_download_endpoint = True
-                    if 'downloads' in file_types:
-                        filtered_links['downloads'].append(link)
-                    break
+        # 1단계: URL 문자열(다운로드 엔드포인트/확장자)만으로 분류, 네트워크 요청 없음
+        if not isinstance(links, LinkBatch):
+            links = LinkBatch.from_urls(links)
+        if active_exts is None:
+            active_exts = self.active_extensions(file_types, custom_extensions)
+        
+        needs_probe = {}
+        for link, path in zip(links.urls, links.paths):
+            is_endpoint = self._is_download_endpoint(link)
+            
+            # 찾는 확장자가 아니면 확장자 매칭 없이 바로 제외 (집합 조회 한 번)
+            if not is_endpoint and active_exts is not None:
+                dot = path.rfind('.')
+                if dot <= path.rfind('/') or path[dot:] not in active_exts:
+                    continue
             
             # 다운로드 엔드포인트가 아닌 경우에만 일반 파일 확장자 확인
-            if not is_download_endpoint:
-                # 각 파일 타입별로 확인
-                for file_type in file_types:
-                    if file_type == 'downloads':  # downloads는 위에서 처리됨
-                        continue
-                    extensions = self.FILE_EXTENSIONS.get(file_type, [])
-                    for ext in extensions:
-                        if path.endswith(ext.lower()):
-                            filtered_links[file_type].append(link)
-                            break
+            file_type = 'downloads' if is_endpoint else self._ext_to_type.get(self._match_extension(path))
+            if file_type not in filtered_links or file_type == 'custom':
+                file_type = None
             
             # 사용자 정의 확장자 확인
-            if custom_extensions:
-                for ext in custom_extensions:
-                    if path.endswith(ext.lower()):
-                        filtered_links['custom'].append(link)
-                        break
+            if custom_extensions and path.endswith(custom_tuple):
+                filtered_links['custom'].add(link)
+            elif custom_extensions and not is_endpoint and file_type:
+                # 사용자 정의 확장자 모드에서 기본 확장자만 일치하는 링크는 HEAD 응답으로 확인
+                needs_probe[link] = file_type
+                continue
+            
+            if file_type:
+                filtered_links[file_type].add(link)
         
-        return filtered_links
+        return filtered_links, needs_probe
     
-    def find_file_links(self, url: str, 
-                       file_types: Optional[List[str]] = None,
-                       custom_extensions: Optional[Set[str]] = None,
-                       max_depth: int = 1) -> Dict[str, List[str]]:
+    async def find_file_links(self, url: str, 
+                              file_types: Optional[List[str]] = None,
+                              custom_extensions: Optional[Set[str]] = None,
+                              max_depth: int = 1,
+                              max_concurrent: int = 5,
+                              delay: float = 0.0,
+                              active_exts: Optional[frozenset] = None) -> Dict[str, List[str]]:
         """
         웹페이지에서 파일 링크를 찾아서 반환
         
+        같은 깊이의 페이지들은 동시에 가져오며, 전체 동시 요청 수는 PAGE_FETCH_WORKERS,
+        호스트별 동시 요청 수는 max_concurrent로 제한합니다.
+        
         Args:
             url: 크롤링할 웹페이지 URL
             file_types: 원하는 파일 타입 목록
             custom_extensions: 사용자 정의 확장자 집합
             max_depth: 크롤링 깊이 (1은 현재 페이지만)
+            max_concurrent: 호스트별 최대 동시 페이지 요청 수
+            delay: 같은 호스트에 대한 요청 후 대기 시간 (초)
+            active_exts: active_extensions로 미리 만든 확장자 집합 (없으면 이 호출에서 한 번 생성)
             
         Returns:
             파일 타입별로 분류된 링크 딕셔너리
         """
-        all_file_links = {}
-        visited_urls = set()
-        urls_to_visit = [(url, 0)]  # (URL, depth)
+        all_file_links = defaultdict(set)
+        if active_exts is None:
+            active_exts = self.active_extensions(file_types, custom_extensions)
+        base_netloc = _cached_urlparse(url).netloc
+        visited_urls = {_normalize_url(url)}
+        current_level = deque([url])
+        semaphore = asyncio.Semaphore(self.PAGE_FETCH_WORKERS)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(max_concurrent))
         
-        while urls_to_visit:
-            current_url, depth = urls_to_visit.pop(0)
-            
-            if current_url in visited_urls or depth >= max_depth:
-                continue
-                
-            visited_urls.add(current_url)
-            self.logger.info(f"크롤링 중: {current_url} (깊이: {depth})")
-            
-            # 페이지 내용 가져오기
-            soup = self.get_page_content(current_url)
-            if not soup:
-                continue
+        for depth in range(max_depth):
+            if not current_level:
+                break
             
-            # 링크 추출
-            links = self.extract_links_from_tags(soup, current_url)
+            # 현재 깊이의 페이지들을 동시에 가져와서 링크 추출
+            pages = await asyncio.gather(*(
+                self._fetch_and_extract(page_url, depth, semaphore, host_semaphores, delay)
+                for page_url in current_level
+            ))
             
-            # 파일 링크 필터링
-            file_links = self.filter_file_links(links, file_types, custom_extensions)
-            
-            # 결과 병합
-            for file_type, link_list in file_links.items():
-                if file_type not in all_file_links:
-                    all_file_links[file_type] = []
-                all_file_links[file_type].extend(link_list)
+            next_level = deque()
+            for links in pages:
+                if links is None:
+                    continue
+                
+                # 파일 링크 필터링 (필요한 HEAD 요청은 비동기로 전송)
+                file_links = await self.filter_file_links_async(links, file_types, custom_extensions, active_exts)
+                
+                # 결과 병합
+                for file_type, link_set in file_links.items():
+                    all_file_links[file_type].update(link_set)
+                
+                # 다음 깊이로 갈 페이지 링크 추가 (HTML 페이지만)
+                if depth < max_depth - 1:
+                    candidates = {}
+                    for link, path, netloc in zip(links.urls, links.paths, links.netlocs):
+                        # 다른 도메인이거나 확장자/다운로드 패턴으로 파일임이 확실한 링크는 제외
+                        if (netloc != base_netloc or self._ext_re.search(path) or
+                                self._is_download_endpoint(link)):
+                            continue
+                        key = _normalize_url(link)
+                        if key not in visited_urls and key not in candidates:
+                            candidates[key] = link
+                    # 확장자로 판별되지 않은 후보는 HEAD 요청을 한꺼번에 보내 파일인지 확인
+                    header_results = await self.classify_by_headers_async(candidates.values())
+                    for key, link in candidates.items():
+                        if not header_results[link]:
+                            visited_urls.add(key)
+                            next_level.append(link)
             
-            # 다음 깊이로 갈 페이지 링크 추가 (HTML 페이지만)
-            if depth < max_depth - 1:
-                for link in links:
-                    if (link not in visited_urls and 
-                        not self.is_file_link(link) and
-                        self._is_same_domain(url, link)):
-                        urls_to_visit.append((link, depth + 1))
+            current_level = next_level
+        
+        return {file_type: list(link_set) for file_type, link_set in all_file_links.items()}
+    
+    async def _fetch_and_extract(self, page_url: str, depth: int,
+                                 semaphore: asyncio.Semaphore,
+                                 host_semaphores: Dict[str, asyncio.Semaphore],
+                                 delay: float) -> Optional[LinkBatch]:
+        """전체/호스트별 동시 요청 수 제한 안에서 페이지를 가져와 링크를 추출"""
+        host_semaphore = host_semaphores[_cached_urlparse(page_url).netloc]
         
-        # 중복 제거
-        for file_type in all_file_links:
-            all_file_links[file_type] = list(set(all_file_links[file_type]))
+        async with semaphore, host_semaphore:
+            self.logger.info(f"크롤링 중: {page_url} (깊이: {depth})")
+            links = await self.get_page_links_async(page_url)
+            if delay > 0:
+                await asyncio.sleep(delay)
         
-        return all_file_links
+        return links
     
     def is_onion_url(self, url: str) -> bool:
         """
@@ -353,7 +906,7 @@ class LinkDetector:
         Returns:
             .onion 주소 여부
         """
-        return '.onion' in urlparse(url).netloc
+        return '.onion' in _cached_urlparse(url).netloc
     
     def _is_same_domain(self, base_url: str, target_url: str) -> bool:
         """
@@ -366,6 +919,12 @@ class LinkDetector:
         Returns:
             같은 도메인 여부
         """
-        base_domain = urlparse(base_url).netloc
-        target_domain = urlparse(target_url).netloc
-        return base_domain == target_domain
\ No newline at end of file
+        base_parsed = _cached_urlparse(base_url)
+        
+        # 대부분의 같은 도메인 링크는 'scheme://netloc' 접두사 비교만으로 판별
+        prefix = f"{base_parsed.scheme}://{base_parsed.netloc}"
+        if target_url.startswith(prefix) and target_url[len(prefix):len(prefix) + 1] in ('', '/', '?', '#'):
+            return True
+        
+        # 스킴이 다르거나 '//host' 형태 등은 파싱해서 비교
+        return base_parsed.netloc == _cached_urlparse(target_url).netloc
\ No newline at end of file
@@ -4,21 +4,59 @@
 명령줄에서 웹 크롤러를 실행할 수 있는 인터페이스를 제공합니다.
 """
 
-import argparse
 import asyncio
+import aiohttp
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # PyInstaller 호환성을 위한 import
 from config import ConfigManager
 
 from web_crawler import WebCrawler, create_crawler_from_config_file
+from file_downloader import install_uvloop
 
 
-def parse_arguments():
-    """명령줄 인자 파싱"""
+def load_json_file(path: Path):
+    """JSON 파일 읽기 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(path: Path, data):
+    """JSON 파일을 들여쓰기 2칸으로 저장 (orjson이 있으면 문자열을 거치지 않고 바이트로 바로 기록)"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+@lru_cache(maxsize=None)
+def _read_config_file(config_file: str) -> dict:
+    """설정 파일은 한 번만 읽고 결과를 캐시 (호출하는 쪽에서는 복사본을 수정)"""
+    return load_json_file(Path(config_file))
+
+
+# -t/--file-types 인자로 선택할 수 있는 파일 타입
+FILE_TYPE_CHOICES = ('documents', 'images', 'videos', 'audio', 'archives', 'data', 'executables', 'downloads', 'others')
+
+
+@lru_cache(maxsize=None)
+def _build_parser():
+    """명령줄 인자 파서 생성 (처음 호출할 때 한 번만 생성하여 재사용, 모듈 import 시에는 만들지 않음)"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="웹사이트에서 파일을 크롤링하고 다운로드하는 도구",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -41,7 +79,7 @@ def parse_arguments():
     parser.add_argument(
         '-t', '--file-types',
         nargs='*',
-        choices=['documents', 'images', 'videos', 'audio', 'archives', 'data', 'executables', 'downloads', 'others'],
+        choices=FILE_TYPE_CHOICES,
         default=None,  # None으로 변경하여 명시적으로 지정되었는지 확인 가능
         help='다운로드할 파일 타입 (기본값: config.json의 file_types 또는 documents images)'
     )
@@ -134,7 +172,18 @@ def parse_arguments():
         help='Tor 제어 포트 (기본값: 9051)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--use-proactor',
+        action='store_true',
+        help='Windows에서 Proactor 이벤트 루프 사용 (기본값: Selector)'
+    )
+    
+    return parser
+
+
+def parse_arguments():
+    """명령줄 인자 파싱"""
+    return _build_parser().parse_args()
 
 
 def setup_crawler_config(args) -> dict:
@@ -145,8 +194,7 @@ def setup_crawler_config(args) -> dict:
     
     try:
         if Path(config_file).exists():
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = dict(_read_config_file(config_file))
     except Exception as e:
         if args.config:  # 명시적으로 지정된 config 파일이 실패한 경우만 에러 출력
             print(f"설정 파일 로드 실패: {e}")
@@ -196,15 +244,66 @@ def setup_crawler_config(args) -> dict:
     return config
 
 
-async def main():
+_event_loop_policy_set = False
+
+
+def set_event_loop_policy(use_proactor: bool = False):
+    """
+    플랫폼에 맞는 이벤트 루프 정책 설정 (프로세스당 한 번만 적용)
+    
+    Windows는 짧은 요청이 많은 크롤링에 유리한 Selector 루프를 기본으로 사용하고,
+    그 외 플랫폼은 uvloop이 설치되어 있으면 uvloop을 사용합니다.
+    """
+    global _event_loop_policy_set
+    if _event_loop_policy_set:
+        return
+    _event_loop_policy_set = True
+    
+    if sys.platform == 'win32':
+        if use_proactor:
+            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        else:
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        install_uvloop()
+
+
+def raise_open_file_limit(target: int = 8192):
+    """동시 소켓이 많을 때를 대비해 열린 파일 수 제한(soft limit)을 가능한 만큼 올림"""
+    try:
+        import resource
+    except ImportError:
+        return
+    
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard != resource.RLIM_INFINITY:
+            target = min(target, hard)
+        if soft != resource.RLIM_INFINITY and soft < target:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ValueError, OSError):
+        pass
+
+
+async def main(args=None):
     """메인 함수"""
-    args = parse_arguments()
+    if args is None:
+        args = parse_arguments()
 
     config_manager = ConfigManager()
     config_manager.load_config(args.config)
     config = config_manager.get_crawler_config()
+    
+    # asyncio.to_thread로 실행하는 블로킹 작업(HEAD 요청, 파일 쓰기 등)이 밀리지 않도록 스레드 풀 확장
+    max_concurrent = config.get('max_concurrent_downloads', args.max_concurrent)
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_concurrent * 4))
 
-    crawler = WebCrawler(config_manager)
+    # 페이지 요청과 파일 다운로드가 같은 커넥션 풀을 사용하도록 세션을 하나만 생성
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60),
+        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    )
+    crawler = WebCrawler(config_manager, session=session)
 
     print(f"🕷️  웹 크롤러 시작")
     print(f"📍 대상 URL: {', '.join(args.urls)}")
@@ -249,8 +348,7 @@ async def main():
             output_file = Path(config.get('download_dir', args.output)) / "found_links.json"
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(file_links, f, ensure_ascii=False, indent=2)
+            write_json_file(output_file, file_links)
             
             print(f"💾 링크 목록 저장: {output_file}")
             
@@ -283,10 +381,14 @@ async def main():
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         sys.exit(1)
+    finally:
+        await crawler.aclose()
+        await session.close()
 
 
 if __name__ == "__main__":
-    if sys.platform == 'win32':
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    args = parse_arguments()
+    set_event_loop_policy(args.use_proactor)
+    raise_open_file_limit()
     
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(args))
\ No newline at end of file
@@ -36,6 +36,7 @@ async def test_onion_download():
         'log_level': 'INFO'
     }
     
+    crawler = None
     try:
         # 다운로드 디렉터리 생성
         Path(config['download_dir']).mkdir(exist_ok=True)
@@ -84,6 +85,9 @@ async def test_onion_download():
     except Exception as e:
         print(f"❌ 테스트 실패: {e}")
         logger.error(f"Onion 다운로드 테스트 에러: {e}")
+    finally:
+        if crawler is not None:
+            await crawler.aclose()
 
 
 def main():
@@ -48,6 +48,7 @@ async def test_onion_crawling():
         'log_level': 'INFO'
     }
     
+    crawler = None
     try:
         crawler = WebCrawler(config)
         
@@ -74,6 +75,9 @@ async def test_onion_crawling():
     except Exception as e:
         print(f"❌ 크롤링 테스트 실패: {e}")
         logger.error(f"Onion 크롤링 에러: {e}")
+    finally:
+        if crawler is not None:
+            await crawler.aclose()
 
 
 def main():
@@ -69,6 +69,7 @@ async def test_web_crawler_with_tor():
     """WebCrawler의 Tor 통합 테스트"""
     print("\n🕷️ WebCrawler Tor 통합 테스트...")
     
+    crawler = None
     try:
         # Tor 활성화된 설정
         config = {
@@ -121,6 +122,9 @@ async def test_web_crawler_with_tor():
     except Exception as e:
         print(f"❌ WebCrawler 테스트 실패: {e}")
         logger.error(f"WebCrawler Tor 테스트 에러: {e}")
+    finally:
+        if crawler is not None:
+            await crawler.aclose()
 
 
 def test_onion_link_detection():
@@ -5,12 +5,26 @@
 
 import asyncio
 import json
+import os
+import sys
 import logging
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Any
+from typing import List, Dict, Optional, Set, Any, Callable, AsyncIterator, Mapping
 from datetime import datetime
 import time
+from functools import cached_property
+from dataclasses import dataclass, field, asdict
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from link_detector import LinkDetector
 from file_downloader import FileDownloader
@@ -19,16 +33,63 @@ from config import ConfigManager
 from ftp.ftp_client import FTPClient
 from api.api_client import APIClient
 
+
+@dataclass
+class CrawlStats:
+    """
+    크롤링 통계
+    
+    start_time/end_time은 소요 시간 계산용 time.monotonic() 값,
+    실제 시작 시각은 wall_start_time에 time.time()으로 기록합니다.
+    """
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    wall_start_time: Optional[float] = None
+    urls_crawled: int = 0
+    files_found: int = 0
+    files_downloaded: int = 0
+    total_download_size: int = 0
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def duration(self) -> float:
+        """소요 시간 (초, 크롤링이 끝나지 않았으면 0)"""
+        if self.start_time is None or self.end_time is None:
+            return 0
+        return self.end_time - self.start_time
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 통계를 dict로 복사 (소요 시간 포함)
+        
+        결과와 메타데이터에는 복사본을 넣어, 같은 인스턴스로 다시 크롤링해도
+        이전에 반환한 통계가 바뀌지 않도록 합니다.
+        """
+        stats = asdict(self)
+        stats['duration'] = self.duration
+        return stats
+
+
 class WebCrawler:
     """웹 크롤러 메인 클래스"""
     
+    # 동시 다운로드 수 자동 조정 시 처리량 측정 간격 (초)
+    TUNE_INTERVAL = 3.0
+    
+    # 처리량 변화가 이 비율 이내이면 잡음으로 보고 동시 다운로드 수를 유지
+    TUNE_TOLERANCE = 0.05
+    
+    # 여러 인스턴스를 만들어도 로그 핸들러를 중복으로 붙이지 않도록 기록
+    _logging_initialized = False
+    
     # def __init__(self, config: Dict[str, Any] = None):
-    def __init__(self, config_manager: str = None):
+    def __init__(self, config_manager: str = None, session: Optional[aiohttp.ClientSession] = None):
         """
         WebCrawler 초기화
         
         Args:
             config: 설정 딕셔너리
+            session: 페이지 요청과 파일 다운로드가 함께 사용할 aiohttp 세션 (선택사항, 종료는 호출자가 담당)
         """
         # # 기본 설정
         self.config = {
@@ -37,7 +98,7 @@ class WebCrawler:
             'max_crawl_depth': 1,
             'timeout': 30,
             'retry_count': 3,
-            'chunk_size': 8192,
+            'chunk_size': 65536,
             'file_types': ['documents', 'images', 'videos', 'audio', 'archives'],
             'custom_extensions': set(),
             'same_domain_only': True,
@@ -48,7 +109,13 @@ class WebCrawler:
             'save_metadata': True,
             'metadata_file': 'crawl_metadata.json',
             'use_tor': False,
-            'tor_port': 9051
+            'tor_port': 9051,
+            'http2': False,
+            # 동시에 크롤링할 시작 URL 수 (네트워크가 불안정하면 낮춰서 사용)
+            'max_concurrent_crawls': min(os.cpu_count() or 1, 32),
+            # 다운로드 처리량을 측정하여 동시 다운로드 수를 자동 조정 (상한: max_tuned_concurrency)
+            'auto_tune_concurrency': True,
+            'max_tuned_concurrency': 64
         }
 
         self.config_manager = config_manager
@@ -62,7 +129,7 @@ class WebCrawler:
                     self.ftp_client = FTPClient(sftp_config)
                     print(f"✅ FTP 클라이언트 초기화 완료")
                 except Exception as e:
-                    self.logger.error(f"Failed to initialize FTP client: {e}")
+                    self.logger.error("Failed to initialize FTP client: %s", e)
                     self.ftp_client = None
             else:
                 print("⚠️ FTP 클라이언트 모듈을 사용할 수 없습니다 (ftp/ftp_client.py 없음)")
@@ -77,7 +144,7 @@ class WebCrawler:
                     self.api_client = APIClient(api_config)
                     print(f"✅ API 클라이언트 초기화 완료")
                 except Exception as e:
-                    self.logger.error(f"Failed to initialize API client: {e}")
+                    self.logger.error("Failed to initialize API client: %s", e)
                     self.api_client = None
             else:
                 print("⚠️ API 클라이언트 모듈을 사용할 수 없습니다 (api/api_client.py 없음)")
@@ -93,15 +160,26 @@ class WebCrawler:
         if self.config['enable_logging']:
             self._setup_logging()
         
+        # 동기 요청(HEAD 확인, 동기 페이지/파일 요청)이 같은 호스트의 keep-alive 연결을 재사용하도록
+        # 링크 탐지기와 다운로더가 하나의 연결 풀을 공유
+        self._http_pool = self._create_http_pool()
+        
         # 컴포넌트 초기화
-        self.link_detector = LinkDetector(use_tor=self.config['use_tor'])
-        self.file_downloader = FileDownloader(
-            download_dir=self.config['download_dir'],
-            max_concurrent=self.config['max_concurrent_downloads'],
-            chunk_size=self.config['chunk_size'],
-            timeout=self.config['timeout'],
-            retry_count=self.config['retry_count']
-        )
+        self.link_detector = LinkDetector(session=self._http_pool, use_tor=self.config['use_tor'],
+                                          aiohttp_session=session, http2=self.config['http2'])
+        # file_downloader는 처음 다운로드할 때 생성 (링크만 찾는 경우 다운로드 디렉터리 등을 만들지 않음)
+        self._conc = self.config['max_concurrent_downloads']
+        
+        # 호스트별 마지막 크롤링 시작 시각 (time.monotonic 기준, 같은 호스트에만 요청 간 지연 적용)
+        self._last_hit: Dict[str, float] = {}
+        
+        # 다운로드 결과를 끝나는 대로 한 줄씩 기록하는 JSONL 파일 (crawl_and_download 실행 중에만 열림)
+        self._results_log = None
+        
+        # session을 받지 않았으면 크롤링을 시작할 때 이벤트 루프 안에서 공유 세션을 직접 생성
+        self._session = session
+        self._owned_session: Optional[aiohttp.ClientSession] = None
+        self._owned_session_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Tor 파일 다운로더 초기화
         self.tor_downloader = None
@@ -115,26 +193,49 @@ class WebCrawler:
         self.logger = logging.getLogger(__name__)
         
         # 크롤링 통계
-        self.crawl_stats = {
-            'start_time': None,
-            'end_time': None,
-            'urls_crawled': 0,
-            'files_found': 0,
-            'files_downloaded': 0,
-            'total_download_size': 0,
-            'errors': []
-        }
+        self.crawl_stats = CrawlStats()
         
         # 메타데이터 저장
         self.metadata = {
             'crawl_info': {},
             'found_links': {},
             'download_results': [],
-            'config': self.config.copy()
+            'config': None  # 저장할 때 현재 설정으로 채움
         }
     
+    @cached_property
+    def file_downloader(self) -> FileDownloader:
+        """파일 다운로더 (처음 사용할 때 생성)"""
+        return FileDownloader(
+            download_dir=self.config['download_dir'],
+            max_concurrent=self.config['max_concurrent_downloads'],
+            chunk_size=self.config['chunk_size'],
+            timeout=self.config['timeout'],
+            retry_count=self.config['retry_count'],
+            session=self._session or self._owned_session,
+            max_concurrency=self._max_download_concurrency(),
+            sync_session=self._http_pool
+        )
+    
+    def _max_download_concurrency(self) -> Optional[int]:
+        """자동 조정 시 동시 다운로드 수 상한 (자동 조정을 하지 않으면 None)"""
+        return self.config['max_tuned_concurrency'] if self.config['auto_tune_concurrency'] else None
+    
+    def _create_http_pool(self) -> requests.Session:
+        """호스트별 연결 풀을 가진 공유 requests 세션 생성 (재시도는 각 컴포넌트가 직접 처리)"""
+        pool_size = max(self.config['max_concurrent_downloads'], LinkDetector.HEAD_PROBE_WORKERS)
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
     def _setup_logging(self):
-        """로깅 설정"""
+        """로깅 설정 (프로세스당 한 번만 적용)"""
+        if WebCrawler._logging_initialized:
+            return
+        WebCrawler._logging_initialized = True
+        
         log_level = getattr(logging, self.config['log_level'].upper(), logging.INFO)
         
         logging.basicConfig(
@@ -168,7 +269,8 @@ class WebCrawler:
         Returns:
             크롤링 및 다운로드 결과
         """
-        self.crawl_stats['start_time'] = time.time()
+        self.crawl_stats.start_time = time.monotonic()
+        self.crawl_stats.wall_start_time = time.time()
         
         # 설정 업데이트
         if file_types:
@@ -180,73 +282,102 @@ class WebCrawler:
             self.file_downloader.download_dir = Path(output_dir)
             self.file_downloader.download_dir.mkdir(parents=True, exist_ok=True)
         
-        self.logger.info(f"크롤링 시작: {len(urls)}개 URL")
+        self.logger.info("크롤링 시작: %s개 URL", len(urls))
+        self._ensure_session()
+        
+        # 링크 탐지와 일반 링크 다운로드를 동시에 진행
+        # (URL 하나의 탐지가 끝날 때마다 새로 발견한 링크를 큐에 넣고, 다운로더가 받는 대로 다운로드)
+        link_queue: asyncio.Queue = asyncio.Queue()
+        seen_links: Set[str] = set()
+        onion_links: List[str] = []
+        
+        def enqueue_links(file_links: Dict[str, List[str]]):
+            for links in file_links.values():
+                for link in links:
+                    if link in seen_links:
+                        continue
+                    seen_links.add(link)
+                    if self.link_detector.is_onion_url(link):
+                        # .onion 링크는 탐지가 끝난 뒤 Tor로 다운로드
+                        onion_links.append(link)
+                    else:
+                        link_queue.put_nowait(link)
+        
+        async def discover():
+            try:
+                return await self._find_links_for_urls(urls, self.config['file_types'],
+                                                       self.config['custom_extensions'],
+                                                       on_links=enqueue_links)
+            finally:
+                link_queue.put_nowait(None)
+        
+        async def queued_links(first_link: str) -> AsyncIterator[str]:
+            link = first_link
+            while link is not None:
+                yield link
+                link = await link_queue.get()
+        
+        download_results = []
+        self._open_results_log()
+        discovery = asyncio.create_task(discover())
+        tuner = (asyncio.create_task(self._tune_concurrency(link_queue.qsize))
+                 if self.config['auto_tune_concurrency'] else None)
+        try:
+            # 첫 링크가 나올 때까지 기다렸다가 다운로드 시작 (링크가 하나도 없으면 다운로더를 실행하지 않음)
+            first_link = await link_queue.get()
+            if first_link is not None:
+                self.logger.info("파일 다운로드 시작...")
+                async for download_result in self.file_downloader.iter_download_files(
+                        queued_links(first_link), output_dir=self.config['download_dir']):
+                    download_results.append(download_result)
+                    self._log_download_result(download_result)
+            results = await discovery
+        except BaseException:
+            # 정상 종료 경로의 _close_results_log까지 가지 않으므로 여기서 닫음
+            self._close_results_log()
+            raise
+        finally:
+            if not discovery.done():
+                discovery.cancel()
+            if tuner is not None:
+                tuner.cancel()
+                await asyncio.gather(tuner, return_exceptions=True)
         
         # 모든 파일 링크 수집
-        all_file_links = {}
+        all_file_links = self._link_buckets(self.config['file_types'], self.config['custom_extensions'])
+        crawl_errors = []
         
-        for url in urls:
-            try:
-                self.logger.info(f"URL 크롤링 중: {url}")
-                
-                # 파일 링크 찾기
-                file_links = self.link_detector.find_file_links(
-                    url=url,
-                    file_types=self.config['file_types'],
-                    custom_extensions=self.config['custom_extensions'],
-                    max_depth=self.config['max_crawl_depth']
-                )
-                
-                # 결과 병합
-                for file_type, links in file_links.items():
-                    if file_type not in all_file_links:
-                        all_file_links[file_type] = []
-                    all_file_links[file_type].extend(links)
-                
-                self.crawl_stats['urls_crawled'] += 1
-                
-                # 요청 간 지연
-                if self.config['delay_between_requests'] > 0:
-                    await asyncio.sleep(self.config['delay_between_requests'])
-                    
-            except Exception as e:
-                error_msg = f"URL 크롤링 실패 {url}: {e}"
+        for url, file_links in zip(urls, results):
+            if isinstance(file_links, Exception):
+                error_msg = f"URL 크롤링 실패 {url}: {file_links}"
                 self.logger.error(error_msg)
-                self.crawl_stats['errors'].append(error_msg)
+                crawl_errors.append(error_msg)
+                continue
+            
+            # 결과 병합 (타입별 dict에 키로 모아서 발견 순서를 유지하며 중복 제거)
+            for file_type, links in file_links.items():
+                all_file_links[file_type].update(dict.fromkeys(links))
+        
+        # 크롤링 통계는 모든 탐지 작업이 끝난 뒤 여기서 한 번에 반영
+        # (동시에 실행되는 탐지 작업은 crawl_stats를 직접 수정하지 않음)
+        self.crawl_stats.errors.extend(crawl_errors)
+        self.crawl_stats.urls_crawled += len(results) - len(crawl_errors)
         
-        # 중복 링크 제거
-        unique_links = set()
-        for file_type, links in all_file_links.items():
-            unique_links.update(links)
-            all_file_links[file_type] = list(set(links))
+        # 탐지 결과를 큐에 넣으면서 이미 모든 링크를 한 번씩 기록했으므로 집합을 다시 만들지 않음
+        unique_links = seen_links
+        all_file_links = {file_type: list(links) for file_type, links in all_file_links.items()}
         
-        self.crawl_stats['files_found'] = len(unique_links)
+        self.crawl_stats.files_found = len(unique_links)
         self.metadata['found_links'] = all_file_links
         
-        self.logger.info(f"총 {len(unique_links)}개 파일 링크 발견")
+        self.logger.info("총 %s개 파일 링크 발견 (일반 링크 %s개 다운로드 완료)", len(unique_links), len(download_results))
         
-        # 파일 다운로드
+        # .onion 링크 다운로드 및 통계
+        normal_count = len(download_results)
         if unique_links:
-            self.logger.info("파일 다운로드 시작...")
-            
-            # .onion 링크와 일반 링크 분리
-            onion_links = [link for link in unique_links if self.link_detector.is_onion_url(link)]
-            normal_links = [link for link in unique_links if not self.link_detector.is_onion_url(link)]
-            
-            download_results = []
-            
-            # 일반 링크 다운로드 (기존 방식)
-            if normal_links:
-                self.logger.info(f"일반 링크 {len(normal_links)}개 다운로드 중...")
-                normal_results = await self.file_downloader.download_files(
-                    urls=normal_links,
-                    output_dir=self.config['download_dir']
-                )
-                download_results.extend(normal_results)
-            
             # .onion 링크 다운로드 (Tor 사용)
             if onion_links and self.tor_downloader:
-                self.logger.info(f".onion 링크 {len(onion_links)}개 다운로드 중...")
+                self.logger.info(".onion 링크 %s개 다운로드 중...", len(onion_links))
                 for onion_url in onion_links:
                     try:
                         result_path = self.tor_downloader.download_file(
@@ -283,7 +414,7 @@ class WebCrawler:
                                 'error': 'Download failed'
                             })
                     except Exception as e:
-                        self.logger.error(f".onion 링크 다운로드 실패 {onion_url}: {e}")
+                        self.logger.error(".onion 링크 다운로드 실패 %s: %s", onion_url, e)
                         download_results.append({
                             'url': onion_url,
                             'success': False,
@@ -292,7 +423,7 @@ class WebCrawler:
                             'error': str(e)
                         })
             elif onion_links and not self.tor_downloader:
-                self.logger.warning(f".onion 링크 {len(onion_links)}개 발견했지만 Tor가 비활성화되어 있습니다.")
+                self.logger.warning(".onion 링크 %s개 발견했지만 Tor가 비활성화되어 있습니다.", len(onion_links))
                 for onion_url in onion_links:
                     download_results.append({
                         'url': onion_url,
@@ -302,14 +433,18 @@ class WebCrawler:
                         'error': 'Tor not enabled'
                     })
             
+            for download_result in download_results[normal_count:]:
+                self._log_download_result(download_result)
+            
             # 통계 업데이트
             successful_downloads = [r for r in download_results if r['success']]
-            self.crawl_stats['files_downloaded'] = len(successful_downloads)
-            self.crawl_stats['total_download_size'] = sum(r['size'] for r in successful_downloads)
+            self.crawl_stats.files_downloaded = len(successful_downloads)
+            self.crawl_stats.total_download_size = sum(r['size'] for r in successful_downloads)
             
             self.metadata['download_results'] = download_results
         
-        self.crawl_stats['end_time'] = time.time()
+        self.crawl_stats.end_time = time.monotonic()
+        self._close_results_log()
         
         # 메타데이터 저장
         if self.config['save_metadata']:
@@ -318,7 +453,7 @@ class WebCrawler:
         # 결과 반환
         result = {
             'success': True,
-            'stats': self.crawl_stats,
+            'stats': self.crawl_stats.snapshot(),
             'found_links': all_file_links,
             'download_results': self.metadata.get('download_results', []),
             'config': self.config
@@ -344,8 +479,17 @@ class WebCrawler:
         Returns:
             크롤링 및 다운로드 결과
         """
+        async def run():
+            try:
+                return await self.crawl_and_download(urls, file_types, custom_extensions, output_dir)
+            finally:
+                # asyncio.run이 끝나면 루프가 닫히므로 이 루프에서 만든 세션/HTTP2 클라이언트도 함께 정리
+                # (다음 호출에서 필요하면 다시 생성, 동기 연결 풀은 aclose()에서 정리)
+                await self._close_owned_session()
+                await self.link_detector.aclose()
+        
         # 비동기 함수를 동기적으로 실행
-        return asyncio.run(self.crawl_and_download(urls, file_types, custom_extensions, output_dir))
+        return asyncio.run(run())
     
     async def find_files_only(self, 
                             urls: List[str], 
@@ -363,32 +507,144 @@ class WebCrawler:
             파일 타입별 링크 딕셔너리
         """
         self.logger.info("파일 링크 탐지 모드")
+        self._ensure_session()
         
-        all_file_links = {}
+        file_types = file_types or self.config['file_types']
+        custom_extensions = custom_extensions or self.config['custom_extensions']
+        all_file_links = self._link_buckets(file_types, custom_extensions)
         
-        for url in urls:
-            try:
-                file_links = self.link_detector.find_file_links(
+        results = await self._find_links_for_urls(urls, file_types, custom_extensions)
+        
+        for url, file_links in zip(urls, results):
+            if isinstance(file_links, Exception):
+                self.logger.error("URL 처리 실패 %s: %s", url, file_links)
+                continue
+            
+            # 결과 병합 (타입별 dict에 키로 모아서 발견 순서를 유지하며 중복 제거)
+            for file_type, links in file_links.items():
+                all_file_links[file_type].update(dict.fromkeys(links))
+        
+        return {file_type: list(links) for file_type, links in all_file_links.items()}
+    
+    @staticmethod
+    def _link_buckets(file_types: Optional[List[str]],
+                      custom_extensions: Optional[Set[str]]) -> Dict[str, Dict[str, None]]:
+        """
+        시작 URL별 탐지 결과를 병합할 타입별 빈 dict 생성
+        
+        find_file_links가 돌려주는 타입(지정한 파일 타입, 사용자 정의 확장자가 있으면 'custom')을
+        미리 만들어 두어, 병합할 때 타입마다 존재 여부를 확인하지 않도록 합니다.
+        """
+        buckets = {file_type: {} for file_type in (file_types or LinkDetector.FILE_EXTENSIONS)}
+        if custom_extensions:
+            buckets['custom'] = {}
+        return buckets
+    
+    async def _find_links_for_urls(self, urls: List[str], file_types: List[str],
+                                   custom_extensions: Set[str],
+                                   on_links: Optional[Callable[[Dict[str, List[str]]], None]] = None) -> List[Any]:
+        """
+        시작 URL들의 파일 링크를 동시에 탐지 (동시 실행 수는 max_concurrent_crawls로 제한)
+        
+        Args:
+            urls: 크롤링할 URL 목록
+            file_types: 찾을 파일 타입 목록
+            custom_extensions: 사용자 정의 확장자
+            on_links: URL 하나의 탐지가 끝날 때마다 그 결과로 호출할 함수 (선택사항)
+            
+        Returns:
+            URL 순서대로 find_file_links 결과 또는 발생한 예외
+        
+        한 번의 호출 안에서 중복된 URL은 한 번만 크롤링하고 같은 결과를 사용합니다.
+        (호출이 끝나면 결과를 보관하지 않으므로 다시 호출하면 항상 새로 크롤링)
+        """
+        semaphore = asyncio.Semaphore(max(1, self.config['max_concurrent_crawls']))
+        delay = self.config['delay_between_requests']
+        max_depth = self.config['max_crawl_depth']
+        
+        # 찾을 확장자 집합은 모든 시작 URL에 같으므로 한 번만 생성
+        active_exts = self.link_detector.active_extensions(file_types, custom_extensions)
+        
+        async def fetch(url: str):
+            async with semaphore:
+                self.logger.info("URL 크롤링 중: %s", url)
+                file_links = await self.link_detector.find_file_links(
                     url=url,
-                    file_types=file_types or self.config['file_types'],
-                    custom_extensions=custom_extensions or self.config['custom_extensions'],
-                    max_depth=self.config['max_crawl_depth']
+                    file_types=file_types,
+                    custom_extensions=custom_extensions,
+                    max_depth=max_depth,
+                    max_concurrent=self.config['max_concurrent_downloads'],
+                    active_exts=active_exts
                 )
-                
-                # 결과 병합
-                for file_type, links in file_links.items():
-                    if file_type not in all_file_links:
-                        all_file_links[file_type] = []
-                    all_file_links[file_type].extend(links)
-                    
-            except Exception as e:
-                self.logger.error(f"URL 처리 실패 {url}: {e}")
+                if on_links:
+                    on_links(file_links)
+                return file_links
+        
+        async def crawl_one(url: str):
+            if delay <= 0:
+                return await fetch(url)
+            
+            # 같은 호스트의 시작 URL은 직전 시작 시각에서 delay 이후로 시작 시각을 예약하고 그때까지 대기
+            # (await 없이 읽고 기록하므로 잠금이 필요 없고, 크롤링 자체는 같은 호스트끼리도 겹쳐서 진행됨)
+            host = urlparse(url).hostname or ''
+            now = time.monotonic()
+            start = max(now, self._last_hit.get(host, float('-inf')) + delay)
+            self._last_hit[host] = start
+            if start > now:
+                # 대기하는 동안 전체 동시 실행 자리는 차지하지 않음
+                await asyncio.sleep(start - now)
+            return await fetch(url)
+        
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(crawl_one(url) for url in unique_urls), return_exceptions=True)
+        results_by_url = dict(zip(unique_urls, results))
+        return [results_by_url[url] for url in urls]
+    
+    async def _tune_concurrency(self, backlog: Callable[[], int] = lambda: 0):
+        """
+        TUNE_INTERVAL마다 다운로드 처리량(bytes/sec)을 측정하여 동시 다운로드 수를 조정
+        
+        직전 구간보다 처리량이 늘면 1 늘리고, 줄면 1 줄입니다 (1 ~ max_tuned_concurrency).
+        
+        Args:
+            backlog: 다운로더에 아직 넘기지 않은 링크 수를 돌려주는 함수
+        
+        구간 시작과 끝에 모든 동시 실행 자리가 차 있거나 대기 중인 링크가 있었을 때만 측정값으로 사용합니다.
+        링크 탐지를 기다리느라 다운로더가 쉬는 동안의 처리량 감소는 혼잡이 아니므로 무시합니다.
+        """
+        downloader = self.file_downloader
+        
+        def saturated() -> bool:
+            return backlog() > 0 or downloader.in_flight >= downloader.concurrency
         
-        # 중복 제거
-        for file_type in all_file_links:
-            all_file_links[file_type] = list(set(all_file_links[file_type]))
+        last_bytes = downloader.bytes_received
+        last_rate = None
+        was_saturated = saturated()
         
-        return all_file_links
+        while True:
+            await asyncio.sleep(self.TUNE_INTERVAL)
+            received = downloader.bytes_received
+            rate = (received - last_bytes) / self.TUNE_INTERVAL
+            last_bytes = received
+            
+            # 쉬거나 일이 모자랐던 구간은 측정값 없음으로 처리 (이전 측정값도 그대로 유지)
+            now_saturated = saturated()
+            sample_valid = was_saturated and now_saturated and rate > 0
+            was_saturated = now_saturated
+            if not sample_valid:
+                continue
+            
+            if last_rate is None or rate > last_rate * (1 + self.TUNE_TOLERANCE):
+                step = 1
+            elif rate < last_rate * (1 - self.TUNE_TOLERANCE):
+                step = -1
+            else:
+                step = 0
+            last_rate = rate
+            
+            if step:
+                self._conc = await downloader.set_concurrency(self._conc + step)
+                self.logger.debug("동시 다운로드 수 조정: %s (%.1f KB/s)", self._conc, rate / 1024)
     
     async def download_files_from_list(self, 
                                      file_urls: List[str], 
@@ -403,7 +659,8 @@ class WebCrawler:
         Returns:
             다운로드 결과 목록
         """
-        self.logger.info(f"{len(file_urls)}개 파일 다운로드 시작")
+        self.logger.info("%s개 파일 다운로드 시작", len(file_urls))
+        self._ensure_session()
         
         return await self.file_downloader.download_files(
             urls=file_urls,
@@ -415,57 +672,174 @@ class WebCrawler:
         try:
             self.metadata['crawl_info'] = {
                 'timestamp': datetime.now().isoformat(),
-                'stats': self.crawl_stats
+                'stats': self.crawl_stats.snapshot()
             }
             
             metadata_path = Path(self.config['download_dir']) / self.config['metadata_file']
             
-            # set 타입을 list로 변환하여 JSON 직렬화 가능하게 만듦
-            serializable_metadata = self.metadata.copy()
-            if 'config' in serializable_metadata:
-                config_copy = serializable_metadata['config'].copy()
-                if 'custom_extensions' in config_copy and isinstance(config_copy['custom_extensions'], set):
-                    config_copy['custom_extensions'] = list(config_copy['custom_extensions'])
-                serializable_metadata['config'] = config_copy
+            # 설정은 저장하는 시점에 한 번만 복사 (사용자 정의 확장자는 정렬된 목록으로)
+            payload = {**self.metadata,
+                       'config': {**self.config,
+                                  'custom_extensions': sorted(self.config.get('custom_extensions') or ())}}
             
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_metadata, f, ensure_ascii=False, indent=2)
+            # set 등 JSON 타입이 아닌 값은 복사본을 만들지 않고 직렬화하면서 _json_default로 변환
+            if orjson is not None:
+                # 문자열을 거치지 않고 바이트로 바로 기록
+                metadata_path.write_bytes(orjson.dumps(payload, default=self._json_default,
+                                                       option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, ensure_ascii=False, indent=2, default=self._json_default)
             
-            self.logger.info(f"메타데이터 저장: {metadata_path}")
+            self.logger.info("메타데이터 저장: %s", metadata_path)
             
         except Exception as e:
-            self.logger.error(f"메타데이터 저장 실패: {e}")
+            self.logger.error("메타데이터 저장 실패: %s", e)
+    
+    @staticmethod
+    def _json_default(obj):
+        """JSON으로 바로 직렬화할 수 없는 값 변환 (set -> list, 읽기 전용 설정 -> dict, 그 외 -> 문자열)"""
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        return str(obj)
+    
+    def _open_results_log(self):
+        """
+        다운로드 결과 JSONL 파일 열기 (메타데이터 파일 옆에 '<이름>.jsonl'로 기록)
+        
+        메타데이터 파일처럼 크롤링할 때마다 새로 씁니다 (이전 실행의 결과와 섞이지 않도록).
+        """
+        # 이전 실행에서 닫히지 않은 파일이 남아 있으면 먼저 닫음
+        self._close_results_log()
+        if not self.config['save_metadata']:
+            return
+        
+        log_path = (Path(self.config['download_dir']) / self.config['metadata_file']).with_suffix('.jsonl')
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._results_log = open(log_path, 'wb', buffering=0)
+        except OSError as e:
+            self.logger.error("다운로드 결과 기록 파일 열기 실패: %s", e)
+    
+    def _log_download_result(self, download_result: Dict[str, Any]):
+        """다운로드 결과 하나를 JSONL 파일에 한 줄로 추가"""
+        if self._results_log is None:
+            return
+        
+        try:
+            if orjson is not None:
+                line = orjson.dumps(download_result, default=self._json_default)
+            else:
+                line = json.dumps(download_result, ensure_ascii=False, default=self._json_default).encode('utf-8')
+            self._results_log.write(line + b"\n")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.error("다운로드 결과 기록 실패: %s", e)
+    
+    def _close_results_log(self):
+        """다운로드 결과 JSONL 파일 닫기"""
+        if self._results_log is not None:
+            self._results_log.close()
+            self._results_log = None
+    
+    def _ensure_session(self):
+        """
+        링크 탐지기와 다운로더가 같은 이벤트 루프 안에서 하나의 aiohttp 세션(커넥션 풀, DNS 캐시)을 쓰도록 준비
+        
+        생성자에서 session을 받았으면 그대로 사용하고, 없으면 현재 루프에서 한 번만 생성합니다.
+        """
+        if self._session is not None:
+            return
+        
+        loop = asyncio.get_running_loop()
+        if (self._owned_session is not None and not self._owned_session.closed and
+                self._owned_session_loop is loop):
+            return
+        
+        connector = aiohttp.TCPConnector(
+            limit=(max(self._max_download_concurrency() or 0, self.config['max_concurrent_downloads']) +
+                   LinkDetector.PAGE_FETCH_WORKERS),
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        self._owned_session = aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        )
+        self._owned_session_loop = loop
+        self.link_detector.aiohttp_session = self._owned_session
+        if 'file_downloader' in self.__dict__:
+            self.file_downloader.set_shared_session(self._owned_session)
+    
+    async def _close_owned_session(self):
+        """직접 생성한 aiohttp 세션 종료 (생성자에서 받은 세션은 호출자가 닫음)"""
+        if self._owned_session is not None and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
+        self._owned_session_loop = None
+        self.link_detector.aiohttp_session = None
+        if 'file_downloader' in self.__dict__:
+            self.file_downloader.set_shared_session(None)
+    
+    async def __aenter__(self) -> 'WebCrawler':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """링크 탐지기/다운로더가 재사용하는 HTTP 세션 정리"""
+        await self._close_owned_session()
+        await self.link_detector.aclose()
+        if 'file_downloader' in self.__dict__:
+            await self.file_downloader.aclose()
+        self._http_pool.close()
+        self._close_results_log()
+        self._flush_api_events()
+    
+    def _flush_api_events(self):
+        """일괄 전송 모드에서 아직 보내지 않은 API 이벤트 전송 (실패한 이벤트는 파일 이름으로 보고)"""
+        if not self.api_client or not self.api_client.batch_events:
+            return
+        for event in self.api_client.flush():
+            print(f"❌ API 전송 실패: {event.get('filename')}")
     
     def _print_summary(self, result: Dict[str, Any]):
         """크롤링 결과 요약 출력"""
         stats = result['stats']
-        duration = stats['end_time'] - stats['start_time'] if stats['end_time'] else 0
-        
-        print("\n" + "="*50)
-        print("📊 크롤링 결과 요약")
-        print("="*50)
-        print(f"🌐 크롤링한 URL 수: {stats['urls_crawled']}")
-        print(f"📁 발견한 파일 수: {stats['files_found']}")
-        print(f"⬇️  다운로드한 파일 수: {stats['files_downloaded']}")
+        duration = stats['duration']
+        
+        # 요약을 한 번에 출력하여 아직 출력 중인 로그와 줄이 섞이지 않도록 함
+        lines = [
+            "\n" + "="*50,
+            "📊 크롤링 결과 요약",
+            "="*50,
+            f"🌐 크롤링한 URL 수: {stats['urls_crawled']}",
+            f"📁 발견한 파일 수: {stats['files_found']}",
+            f"⬇️  다운로드한 파일 수: {stats['files_downloaded']}",
+        ]
         
         if stats['total_download_size'] > 0:
             size_str = self.file_downloader.format_size(stats['total_download_size'])
-            print(f"💾 총 다운로드 크기: {size_str}")
+            lines.append(f"💾 총 다운로드 크기: {size_str}")
         
-        print(f"⏱️  소요 시간: {duration:.2f}초")
+        lines.append(f"⏱️  소요 시간: {duration:.2f}초")
         
         if stats['errors']:
-            print(f"❌ 오류 수: {len(stats['errors'])}")
+            lines.append(f"❌ 오류 수: {len(stats['errors'])}")
         
         # 파일 타입별 통계
         found_links = result['found_links']
         if found_links:
-            print("\n📂 파일 타입별 발견 수:")
+            lines.append("\n📂 파일 타입별 발견 수:")
             for file_type, links in found_links.items():
                 if links:
-                    print(f"   {file_type}: {len(links)}개")
+                    lines.append(f"   {file_type}: {len(links)}개")
         
-        print("="*50)
+        lines.append("="*50)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_supported_file_types(self) -> Dict[str, List[str]]:
         """지원하는 파일 타입 목록 반환"""
@@ -483,9 +857,9 @@ class WebCrawler:
         for key, value in kwargs.items():
             if key in self.config:
                 self.config[key] = value
-                self.logger.info(f"설정 업데이트: {key} = {value}")
+                self.logger.info("설정 업데이트: %s = %s", key, value)
             else:
-                self.logger.warning(f"알 수 없는 설정: {key}")
+                self.logger.warning("알 수 없는 설정: %s", key)
 
     def send_to_ftp_api(self, file_path, filename, file_hash, url):
         """FTP 업로드 및 API 전송"""
@@ -499,7 +873,7 @@ class WebCrawler:
                     ftp_success = self._handle_ftp_upload(file_path, filename)
                     ftp_status = "success" if ftp_success else "failed"
                 except Exception as e:
-                    self.logger.error(f"FTP upload failed: {e}")
+                    self.logger.error("FTP upload failed: %s", e)
                     ftp_success = False
                     ftp_status = "failed"
             else:
@@ -516,7 +890,11 @@ class WebCrawler:
                     },
                     "path": self.ftp_client.remote_directory if self.ftp_client else None,
                 }  
-                if self.api_client.send_file_event(metadata):
+                sent = self.api_client.send_file_event(metadata)
+                if sent is None:
+                    # 일괄 전송 모드: 버퍼가 차거나 크롤러를 닫을 때 전송
+                    print(f"⏳ API 전송 대기: {filename}")
+                elif sent:
                     print(f"🚀 API 전송 성공: {filename}")
                 else:
                     print(f"❌ API 전송 실패: {filename}")
@@ -534,7 +912,7 @@ class WebCrawler:
         try:
             return self.ftp_client.upload_file(file_path, file_name)
         except Exception as e:
-            self.logger.error(f"FTP upload error: {e}")
+            self.logger.error("FTP upload error: %s", e)
             return False
     
 
@@ -572,8 +950,8 @@ async def quick_crawl(url: str,
     Returns:
         크롤링 결과
     """
-    crawler = WebCrawler()
-    return await crawler.crawl_and_download([url], file_types, output_dir=output_dir)
+    async with WebCrawler() as crawler:
+        return await crawler.crawl_and_download([url], file_types, output_dir=output_dir)
 
 
 def quick_crawl_sync(url: str, 